@@ -1,33 +1,83 @@
 import os
 import sys
 import argparse
-from flask import Flask, jsonify, request, send_from_directory, Response
-from tbparse import SummaryReader
-import pandas as pd
+from flask import Flask, jsonify, request, send_from_directory, Response, g
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from waitress import serve # Production WSGI server
+from tensorboard.compat.proto import event_pb2
+from tensorboard.plugins.hparams import plugin_data_pb2
+from google.protobuf.message import DecodeError
+import numpy as np
+import orjson
 from collections import defaultdict
 import logging
 import time
 import webbrowser
 import threading
 import re # For regex matching in log files
+import struct # For TFRecord framing in event files
+import hashlib # For naming per-file parse cache entries
+import tempfile
+import mmap # Zero-copy access to event file bytes
+from array import array # Typed append buffers for scalar parsing
 from pathlib import Path # For easier path manipulation
+from types import MappingProxyType # Read-only view of the published cache
+from functools import lru_cache
 import atexit # To handle thread shutdown
+import multiprocessing # Start method of the parsing pool
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor # For parallel event file parsing and log reads
+from concurrent.futures.process import BrokenProcessPool
+try:
+    import google_crc32c # Optional: hardware-accelerated CRC32C for verifying event file records
+except ImportError:
+    google_crc32c = None
+try:
+    import ahocorasick # Optional: Aho-Corasick automaton for searching Hydra logs for many run names at once
+except ImportError:
+    ahocorasick = None
+try:
+    from watchdog.observers import Observer # Optional: filesystem notifications for new event files
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
 
 # --- Globals ---
-RUN_DATA_CACHE = {} # Now stores {
+RUN_DATA_CACHE = MappingProxyType({}) # Read-only; replaced as a whole on every swap. Now stores {
                     #   'run_name': {
-                    #     'scalars': {...},
+                    #     'scalars': {tag: {'steps': ndarray, 'values': ndarray, 'wall_times': ndarray}},
+                    #                # + 'downsampled_json': bytes, once a long series was requested with ?resolution=low
+                    #     'scalars_json': {tag: bytes}, # encode_scalar_series JSON of each 'scalars' entry
                     #     'hydra_overrides': '...' | None,
                     #     'hparams': {'hparam_dict': {...}, 'metric_dict': {...}} | None
                     #   }
                     # }
 CACHE_LOAD_TIME = 0
+CACHE_UPDATED_AT = 0.0 # time.time() of the last RUN_DATA_CACHE swap; identifies the cache generation
+RUNS_INFO_JSON = b'[]' # /api/runs body for RUN_DATA_CACHE, encoded when the run set is swapped
+DOWNSAMPLE_THRESHOLD_POINTS = 4000 # Series longer than this are LTTB-downsampled for ?resolution=low
+DOWNSAMPLE_TARGET_POINTS = 2000 # Points kept per downsampled series; more than a chart can show
+COMPRESSED_CACHE_MAX_ENTRIES = 64 # Compressed API responses kept between cache swaps
 LOG_ROOT_DIR = None
 HYDRA_MULTIRUN_DIR = None # Store the path to hydra multirun
 HYDRA_SINGLE_RUN_LOG_DIR = None # New: Store the path to normal hydra log outputs
 REFRESH_INTERVAL_SECONDS = 60 # Refresh cache every 60 seconds
 background_thread = None
 stop_event = threading.Event() # Used to signal the background thread to stop
+REFRESH_REQUESTED = threading.Event() # Set to run the next background refresh before the interval elapses
+BACKGROUND_THREAD_LOCK = threading.Lock() # /api/refresh may start the background thread from several request threads
+WATCH_DEBOUNCE_SECONDS = 1 # Quiet period after the last event file change before a requested refresh runs
+watch_observer = None
+FOLLOW_INTERVAL_SECONDS = 2 # Minimum pause between checks for appended event data; 0 disables following
+follow_thread = None
+TRACKED_EVENT_FILES = {} # file_path -> {'run': run_name, 'size': int, 'end_offset': int}, for tail-following
+CACHE_SWAP_LOCK = threading.RLock() # Serializes replacing RUN_DATA_CACHE/TRACKED_EVENT_FILES
+SUBMITIT_LOG_NAME_PATTERN = re.compile(r'(\d+)_(\d+)(?:_log)?\.out') # jobid_taskid_log.out or jobid_taskid.out
+SUBMITIT_DIR_NAME_PATTERN = re.compile(r'(\d+)_(\d+)') # JOB_TASK directory names
+LAST_EVENT_DATA = None # (event file fingerprint, temp_cache, runs_to_keep, tracked_event_files, scalar_runs) of the last refresh
+SUBMITIT_LOG_SCANS = {} # log_path -> (scan_key, run names found), reused by the next refresh
+SINGLE_RUN_LOG_SCANS = {} # Same for the logs of 'normal' Hydra job output directories
+HYDRA_OVERRIDES_READS = {} # run_name -> (log or job dir, overrides.yaml path, mtime_ns, size, content) of earlier refreshes
 
 # --- Flask App Setup ---
 frontend_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend")
@@ -37,251 +87,1126 @@ app.logger.setLevel(logging.INFO)
 for handler in app.logger.handlers:
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
 
+class CompressedResponseCache:
+    """Bounded flask-compress cache backend. Entries are keyed on the cache generation, so stale ones are never hit."""
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        if key not in self.data and len(self.data) >= COMPRESSED_CACHE_MAX_ENTRIES:
+            self.data.clear() # Mostly entries of older cache generations; cheaper than tracking recency
+        self.data[key] = value
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() encodes in Rust instead of the json module."""
+    OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY # Sorted keys, like Flask's default provider
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.OPTIONS), mimetype="application/json")
+
+app.json = OrjsonProvider(app)
+
+# Scalar JSON (steps, smooth values) compresses very well. API responses only depend on the
+# cache generation and the query, so their compressed bodies are reused until the next refresh.
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_LEVEL"] = 1 # gzip; fast levels already get most of the size reduction on this data
+app.config["COMPRESS_MIN_SIZE"] = 2048
+app.config["COMPRESS_CACHE_BACKEND"] = CompressedResponseCache
+# Keyed on the generation the view read (see _record_cache_generation), not the one current after it ran
+app.config["COMPRESS_CACHE_KEY"] = lambda req: f"{g.get('cache_updated_at', CACHE_UPDATED_AT)}:{req.full_path}"
+Compress(app)
+
+@app.before_request
+def _record_cache_generation():
+    # Swaps publish the cache before bumping CACHE_UPDATED_AT, so reading it before the view reads the
+    # cache means the body is never older than the recorded generation. ETags and the compressed
+    # response cache both use this value, so a swap while the view runs cannot mislabel its body.
+    g.cache_updated_at = CACHE_UPDATED_AT
+
 
 # --- Helper Function: Find Hydra Overrides ---
-def find_hydra_overrides(tb_run_name, hydra_multirun_root, log_root_dir):
+def _iter_submitit_logs(root):
     """
-    Tries to find the hydra overrides.yaml content for a given TensorBoard run name.
+    Yields the os.DirEntry of every '.out' file in a '.submitit/<job>/' directory below root.
+
+    A single os.scandir walk replaces the rglob passes: DirEntry caches the file type from
+    readdir, so no entry needs an extra stat. Hidden directories other than '.submitit' are
+    skipped, and symlinked directories are not followed.
+    """
+    pending_dirs = [root]
+    while pending_dirs:
+        dir_path = pending_dirs.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e_scan: # PermissionError and directories removed mid-walk
+            app.logger.debug(f"Could not scan directory {dir_path} for Submitit logs: {e_scan}")
+            continue
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name == ".submitit":
+                try:
+                    with os.scandir(entry.path) as job_it:
+                        job_dirs = [job_entry for job_entry in job_it if job_entry.is_dir(follow_symlinks=False)]
+                    for job_dir in job_dirs:
+                        with os.scandir(job_dir.path) as log_it:
+                            for log_entry in log_it:
+                                if log_entry.name.endswith(".out") and log_entry.is_file():
+                                    yield log_entry
+                except OSError as e_scan:
+                    app.logger.debug(f"Could not scan Submitit directory {entry.path}: {e_scan}")
+            elif not entry.name.startswith("."):
+                pending_dirs.append(entry.path)
+
+def _run_names_pattern(run_names):
+    """
+    Builds a regex alternation of run names shaped like a prefix trie, e.g. 'base(?:_v2|\\.x)?|v2'.
+    The regex engine then rejects a position after one mismatching character, instead of
+    trying every name there. Optional continuations are greedy, so longer names win.
+    """
+    trie = {}
+    for name in run_names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[''] = {} # End of a name
+
+    def node_pattern(node):
+        branches = [re.escape(char) + node_pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + pattern + ')?' if '' in node else pattern
+    return node_pattern(trie)
+
+@lru_cache(maxsize=4) # One matcher per searched name set (multirun and single-run), kept across refreshes
+def _build_run_name_matcher(run_names):
+    """
+    Returns a function mapping a text to the set of run names it contains.
+    run_names must be a frozenset; while it stays the same, refreshes reuse the built matcher.
+
+    With pyahocorasick installed, one Aho-Corasick automaton finds all (overlapping) names in a
+    single pass in C. Otherwise all names are matched by one compiled regex instead of one
+    substring search per name: the trie is wrapped in a lookahead, so it matches at every
+    position, and it prefers longer names.
+    A name that is a prefix of a longer name matched at the same position (e.g. 'run1' within
+    'run10') is added from a precomputed table, so the result equals {n for n in run_names if n in text}.
+    """
+    names = set(run_names)
+    always_found = {''} & names # '' (event files directly in the log root) is contained in every text
+    names.discard('')
+    if not names:
+        return lambda text: set(always_found)
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for name in names:
+            automaton.add_word(name, name)
+        automaton.make_automaton()
+        return lambda text: always_found.union(name for _, name in automaton.iter(text))
+
+    pattern = re.compile("(?=(" + _run_names_pattern(names) + "))")
+    prefix_names = {name: {other for other in names if other != name and name.startswith(other)} for name in names}
+
+    def find_run_names(text):
+        found = set(always_found)
+        for match in pattern.finditer(text):
+            name = match.group(1)
+            if name not in found:
+                found.add(name)
+                found.update(prefix_names[name])
+        return found
+    return find_run_names
+
+def _read_log_prefix(log_path, max_bytes):
+    with open(log_path, 'rb') as f: # Reads at most max_bytes, however long the log has grown
+        return f.read(max_bytes).decode('utf-8', errors='ignore')
+
+def _thread_map(function, items):
+    """list(map(function, items)) for I/O-bound functions, on a thread pool when there is more than one item."""
+    if len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(items))) as executor:
+            return list(executor.map(function, items))
+    return [function(item) for item in items]
+
+def _scan_logs_for_run_names(log_paths, max_bytes, find_run_names, names_key, previous_scans, current_scans, file_ids=None):
+    """
+    Finds the run names in the first max_bytes of each log. The result of the previous refresh is
+    reused while a log's mtime/size and the searched names are unchanged, so steady-state
+    refreshes only read new or modified logs.
+
+    Each log is stat'ed, read and searched by its own task on a thread pool. The stat and read
+    syscalls mostly wait on the disk or network filesystem and release the GIL, so their
+    latencies overlap instead of adding up.
+
+    If file_ids is a dict, it receives log_path -> (st_dev, st_ino) from those stats, for logs
+    whose platform reports a real inode number (os.stat does on Windows too, but may return 0).
+
+    Returns:
+        dict[str, set[str]]: log_path -> run names found. Logs that could not be read are left out.
+    """
+    def read_and_scan(log_path):
+        try:
+            file_stat = os.stat(log_path)
+            file_id = (file_stat.st_dev, file_stat.st_ino) if file_stat.st_ino else None
+            scan_key = (file_stat.st_mtime_ns, file_stat.st_size, max_bytes, names_key)
+            previous_scan = previous_scans.get(log_path)
+            if previous_scan is not None and previous_scan[0] == scan_key:
+                return previous_scan, file_id
+            return (scan_key, find_run_names(_read_log_prefix(log_path, max_bytes))), file_id
+        except OSError as e_read:
+            return e_read
+
+    scans = _thread_map(read_and_scan, log_paths)
+
+    found_by_log = {}
+    for log_path, scan in zip(log_paths, scans):
+        if isinstance(scan, OSError):
+            app.logger.warning(f"Could not read or search log file {log_path}: {scan}")
+            continue
+        scan, file_id = scan
+        if file_ids is not None and file_id is not None:
+            file_ids[log_path] = file_id
+        current_scans[log_path] = scan
+        found_by_log[log_path] = scan[1]
+    return found_by_log
+
+def _remembered_overrides(tb_run_name, source_path):
+    """
+    Returns the overrides.yaml content read for a run by an earlier refresh, if the run was matched
+    to the same log (or job directory) and the file's mtime/size are unchanged. Otherwise None.
+    """
+    remembered = HYDRA_OVERRIDES_READS.get(tb_run_name)
+    if remembered is None or remembered[0] != source_path:
+        return None
+    try:
+        file_stat = os.stat(remembered[1])
+    except OSError:
+        return None
+    if (file_stat.st_mtime_ns, file_stat.st_size) != remembered[2:4]:
+        return None
+    return remembered[4]
+
+def _read_overrides(tb_run_name, source_path, overrides_file):
+    """
+    Reads an overrides.yaml and remembers it for _remembered_overrides. Opening it directly replaces a
+    separate is_file() check; raises FileNotFoundError when it does not exist.
+    """
+    with open(overrides_file, 'rb') as f:
+        file_stat = os.fstat(f.fileno()) # Before reading, so a concurrent rewrite is caught by the next refresh
+        content = f.read().decode('utf-8')
+    HYDRA_OVERRIDES_READS[tb_run_name] = (source_path, overrides_file, file_stat.st_mtime_ns, file_stat.st_size, content)
+    return content
+
+def index_submitit_logs(hydra_multirun_root, run_names):
+    """
+    Maps each run name to the first Submitit log that mentions it, reading every log at most once.
+
+    Logs named like jobid_taskid_log.out are searched before other .out files (jobid_taskid.out),
+    and only the first 50KB of each log is searched. A log reachable under several names
+    (symlinks or hard links) is matched once, under the first name in that order.
 
     Args:
-        tb_run_name (str): The directory name of the TensorBoard run.
         hydra_multirun_root (str): The absolute path to the hydra multirun directory.
-        log_root_dir (str): The absolute path to the main log directory (parent of tb_run_name).
+        run_names (Iterable[str]): The TensorBoard run names to look for.
 
     Returns:
-        str | None: The content of the overrides.yaml file, or None if not found/error.
+        dict[str, Path]: run_name -> path of its Submitit log. Runs without a match are left out.
     """
+    global SUBMITIT_LOG_SCANS
     if not hydra_multirun_root or not os.path.isdir(hydra_multirun_root):
-        return None
-
-    # Construct the full path to the TB run directory to potentially search for in logs
-    # This assumes the tb_run_name itself might be logged. Adjust if a different ID is logged.
-    tb_run_path_identifier = os.path.join(log_root_dir, tb_run_name)
-    # Alternative: Just use the run name as the identifier to search for
-    search_term = tb_run_name
+        return {}
+    # Logs are searched for all names (not just the ones still pending), so scans stay reusable
+    names_key = frozenset(run_names)
+    pending_run_names = set(names_key)
+    find_run_names = _build_run_name_matcher(names_key)
+    previous_scans, current_scans = SUBMITIT_LOG_SCANS, {}
+    log_paths_by_run = {}
+
+    submitit_logs = sorted(_iter_submitit_logs(hydra_multirun_root), key=lambda entry: not entry.name.endswith("_log.out"))
+    ordered_logs = [entry.path for entry in submitit_logs]
+    file_ids = {} # Filled from the stats the scan tasks make anyway
+    found_by_log = _scan_logs_for_run_names(
+        ordered_logs, 50 * 1024, find_run_names, names_key, previous_scans, current_scans, file_ids # Check first 50KB
+    )
+    seen_file_ids = set() # (st_dev, st_ino); a log reachable through several names/symlinks matches once
+    for log_path in ordered_logs:
+        if not pending_run_names:
+            break
+        file_id = file_ids.get(log_path) # None if unreadable or without a usable inode number: never deduplicated
+        if file_id is not None:
+            if file_id in seen_file_ids:
+                continue
+            seen_file_ids.add(file_id)
+        for run_name in found_by_log.get(log_path, set()) & pending_run_names:
+            log_paths_by_run[run_name] = Path(log_path)
+            app.logger.debug(f"Found potential match for run '{run_name}' in log file: {log_path}")
+        pending_run_names.difference_update(log_paths_by_run)
+    SUBMITIT_LOG_SCANS = current_scans # Drops logs that disappeared
+    return log_paths_by_run
+
+def find_hydra_overrides(tb_run_name, submitit_log_path):
+    """
+    Tries to find the hydra overrides.yaml content for a given TensorBoard run name.
 
-    app.logger.debug(f"Searching for Hydra overrides for '{tb_run_name}' using search term '{search_term}' in '{hydra_multirun_root}'")
+    Args:
+        tb_run_name (str): The directory name of the TensorBoard run.
+        submitit_log_path (Path): The Submitit log mentioning the run, from index_submitit_logs.
 
+    Returns:
+        str | None: The content of the overrides.yaml file, or None if not found/error.
+    """
+    app.logger.debug(f"Using Submitit log file: {submitit_log_path} for run '{tb_run_name}'")
+    remembered_content = _remembered_overrides(tb_run_name, submitit_log_path)
+    if remembered_content is not None:
+        return remembered_content # Same log and unchanged overrides.yaml: skip deriving the directory again
+
+    # --- Derive Hydra run directory ---
+    # Example submitit_log_path: /path/to/multirun/DATE/TIME/.submitit/JOB_ARRAY/JOB_ARRAY_TASK_log.out
+    # Target Hydra Dir:          /path/to/multirun/DATE/TIME/TASK/
     try:
-        # Search recursively for .out files containing the search term
-        # Using pathlib and glob for potentially better cross-platform compatibility
-        hydra_path = Path(hydra_multirun_root)
-        # Search within .submitit directories for log files
-        matching_log_files = []
-        # Look for typical submitit log patterns
-        for log_file in hydra_path.rglob(".submitit/*/*_log.out"):
-            try:
-                with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    # Read file content efficiently (check first N lines/KB?)
-                    # For simplicity now, read the whole file if small, or chunk it
-                    content_to_check = f.read(50 * 1024) # Check first 50KB
-                    if search_term in content_to_check:
-                        matching_log_files.append(log_file)
-                        app.logger.debug(f"Found potential match in log file: {log_file}")
-                        break # Take the first match found
-            except Exception as e_read:
-                app.logger.warning(f"Could not read or search log file {log_file}: {e_read}")
-                continue # Skip this file
-
-        if not matching_log_files:
-            # Try another common pattern: jobid_taskid.out
-            for log_file in hydra_path.rglob(".submitit/*/*.out"):
-                 try:
-                     with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                         content_to_check = f.read(50 * 1024)
-                         if search_term in content_to_check:
-                             matching_log_files.append(log_file)
-                             app.logger.debug(f"Found potential match in log file (pattern 2): {log_file}")
-                             break
-                 except Exception as e_read:
-                     app.logger.warning(f"Could not read or search log file {log_file} (pattern 2): {e_read}")
-                     continue
-
-        if not matching_log_files:
-            app.logger.debug(f"No Submitit log file found containing '{search_term}' for run '{tb_run_name}'.")
+        submitit_dir = submitit_log_path.parent # .submitit/JOB_ARRAY/ or .submitit/JOB_TASK/
+        multirun_timestamp_dir = submitit_dir.parent.parent # DATE/TIME/
+
+        # Extract task ID from filename (e.g., 12345_0_log.out -> 0)
+        log_filename = submitit_log_path.name
+        task_id = None
+
+        # Patterns 1 and 2: jobid_taskid_log.out or jobid_taskid.out
+        name_match = SUBMITIT_LOG_NAME_PATTERN.match(log_filename)
+        if name_match:
+            task_id = name_match.group(2)
+            app.logger.debug(f"Extracted Task ID '{task_id}' from filename '{log_filename}'")
+
+        # Pattern 3: Check directory name like JOB_TASK
+        if not task_id:
+            dir_match = SUBMITIT_DIR_NAME_PATTERN.match(submitit_dir.name)
+            if dir_match:
+                task_id = dir_match.group(2)
+                app.logger.debug(f"Extracted Task ID '{task_id}' from directory name '{submitit_dir.name}'")
+
+        # Pattern 4: SLURM-like slurm-%j_%t.out (less reliable for task ID alone)
+        # If still no task_id, we might need more sophisticated logic or user config
+
+        if task_id is None:
+            app.logger.warning(f"Could not extract task ID from log filename '{log_filename}' or dir '{submitit_dir.name}' for run '{tb_run_name}'. Cannot find Hydra overrides.")
             return None
 
-        # Take the first match
-        submitit_log_path = matching_log_files[0]
-        app.logger.debug(f"Using Submitit log file: {submitit_log_path} for run '{tb_run_name}'")
+        # Construct potential Hydra run directory path
+        hydra_run_dir = multirun_timestamp_dir / task_id
 
-        # --- Derive Hydra run directory ---
-        # Example submitit_log_path: /path/to/multirun/DATE/TIME/.submitit/JOB_ARRAY/JOB_ARRAY_TASK_log.out
-        # Target Hydra Dir:          /path/to/multirun/DATE/TIME/TASK/
-        try:
-            submitit_dir = submitit_log_path.parent # .submitit/JOB_ARRAY/ or .submitit/JOB_TASK/
-            multirun_timestamp_dir = submitit_dir.parent.parent # DATE/TIME/
-
-            # Extract task ID from filename (e.g., 12345_0_log.out -> 0)
-            log_filename = submitit_log_path.name
-            task_id = None
-
-            # Pattern 1: jobid_taskid_log.out
-            match1 = re.match(r'(\d+)_(\d+)_log\.out', log_filename)
-            if match1:
-                task_id = match1.group(2)
-                app.logger.debug(f"Extracted Task ID '{task_id}' from filename '{log_filename}' (pattern 1)")
-
-            # Pattern 2: jobid_taskid.out
-            if not task_id:
-                match2 = re.match(r'(\d+)_(\d+)\.out', log_filename)
-                if match2:
-                    task_id = match2.group(2)
-                    app.logger.debug(f"Extracted Task ID '{task_id}' from filename '{log_filename}' (pattern 2)")
-
-            # Pattern 3: Check directory name like JOB_TASK
-            if not task_id:
-                dir_match = re.match(r'(\d+)_(\d+)', submitit_dir.name)
-                if dir_match:
-                    task_id = dir_match.group(2)
-                    app.logger.debug(f"Extracted Task ID '{task_id}' from directory name '{submitit_dir.name}'")
-
-            # Pattern 4: SLURM-like slurm-%j_%t.out (less reliable for task ID alone)
-            # If still no task_id, we might need more sophisticated logic or user config
-
-            if task_id is None:
-                app.logger.warning(f"Could not extract task ID from log filename '{log_filename}' or dir '{submitit_dir.name}' for run '{tb_run_name}'. Cannot find Hydra overrides.")
-                return None
-
-            # Construct potential Hydra run directory path
-            hydra_run_dir = multirun_timestamp_dir / task_id
-
-            if not hydra_run_dir.is_dir():
-                # Sometimes the task ID might be zero-padded, try that
-                try:
-                    padded_task_id = f"{int(task_id):03d}" # Example: 3 digits padding
-                    hydra_run_dir_padded = multirun_timestamp_dir / padded_task_id
-                    if hydra_run_dir_padded.is_dir():
-                        hydra_run_dir = hydra_run_dir_padded
-                        app.logger.debug(f"Using zero-padded task ID directory: {hydra_run_dir}")
-                    else:
-                         app.logger.warning(f"Derived Hydra run directory '{hydra_run_dir}' (and padded variants) do not exist for run '{tb_run_name}'.")
-                         return None
-                except ValueError: # If task_id wasn't an integer
-                     app.logger.warning(f"Derived Hydra run directory '{hydra_run_dir}' does not exist for run '{tb_run_name}'.")
+        if not hydra_run_dir.is_dir():
+            # Sometimes the task ID might be zero-padded, try that
+            try:
+                padded_task_id = f"{int(task_id):03d}" # Example: 3 digits padding
+                hydra_run_dir_padded = multirun_timestamp_dir / padded_task_id
+                if hydra_run_dir_padded.is_dir():
+                    hydra_run_dir = hydra_run_dir_padded
+                    app.logger.debug(f"Using zero-padded task ID directory: {hydra_run_dir}")
+                else:
+                     app.logger.warning(f"Derived Hydra run directory '{hydra_run_dir}' (and padded variants) do not exist for run '{tb_run_name}'.")
                      return None
+            except ValueError: # If task_id wasn't an integer
+                 app.logger.warning(f"Derived Hydra run directory '{hydra_run_dir}' does not exist for run '{tb_run_name}'.")
+                 return None
 
 
-            # Look for overrides.yaml
-            overrides_file = hydra_run_dir / ".hydra" / "overrides.yaml"
-            if overrides_file.is_file():
-                app.logger.info(f"Found Hydra overrides file for run '{tb_run_name}': {overrides_file}")
-                try:
-                    content = overrides_file.read_text(encoding='utf-8')
-                    return content
-                except Exception as e_read_yaml:
-                    app.logger.error(f"Error reading overrides file {overrides_file}: {e_read_yaml}")
-                    return None # Indicate error reading
-            else:
-                app.logger.debug(f"Overrides file not found at '{overrides_file}' for run '{tb_run_name}'.")
-                return None
-
-        except Exception as e_derive:
-            app.logger.error(f"Error deriving Hydra path for run '{tb_run_name}' from log '{submitit_log_path}': {e_derive}", exc_info=True)
+        # Look for overrides.yaml
+        overrides_file = hydra_run_dir / ".hydra" / "overrides.yaml"
+        try:
+            content = _read_overrides(tb_run_name, submitit_log_path, overrides_file)
+        except FileNotFoundError:
+            app.logger.debug(f"Overrides file not found at '{overrides_file}' for run '{tb_run_name}'.")
             return None
-
-    except Exception as e_glob:
-        app.logger.error(f"Error searching for log files in '{hydra_multirun_root}': {e_glob}", exc_info=True)
+        except Exception as e_read_yaml:
+            app.logger.error(f"Error reading overrides file {overrides_file}: {e_read_yaml}")
+            return None # Indicate error reading
+        app.logger.info(f"Found Hydra overrides file for run '{tb_run_name}': {overrides_file}")
+        return content
+
+    except Exception as e_derive:
+        app.logger.error(f"Error deriving Hydra path for run '{tb_run_name}' from log '{submitit_log_path}': {e_derive}", exc_info=True)
         return None
 
-def find_hydra_overrides_single_run(tb_run_name, hydra_single_run_root, tb_log_root_dir_context):
+def index_hydra_single_run_logs(hydra_single_run_root, run_names):
     """
-    Tries to find Hydra overrides.yaml or config.yaml for a given TensorBoard run
-    by searching log files in 'normal' Hydra output directories. The expected structure
-    for these directories is hydra_single_run_root/YYYY-MM-DD/HH-MM-SS/, where the
-    HH-MM-SS directory contains the log files and the .hydra configuration.
+    Maps each run name to the first 'normal' Hydra job output directory whose logs mention it,
+    reading every log at most once. The expected structure for these directories is
+    hydra_single_run_root/YYYY-MM-DD/HH-MM-SS/, where the HH-MM-SS directory contains the
+    log files (*.log, first 200KB searched) and the .hydra configuration. As before, the first
+    matching directory wins even if it has no .hydra configuration (the run then gets none).
+
     Args:
-        tb_run_name (str): The directory name of the TensorBoard run (search term).
         hydra_single_run_root (str): Absolute path to the root of Hydra single-run outputs
                                      (e.g., 'outputs/' or 'logs/hydra/').
-        tb_log_root_dir_context (str): Absolute path to the main TensorBoard log directory
-                                       (parent of tb_run_name), for context.
+        run_names (Iterable[str]): The TensorBoard run names (dir names relative to the log root) to look for.
 
     Returns:
-        str | None: Content of overrides.yaml or config.yaml, or None if not found.
+        dict[str, Path]: run_name -> Hydra job output directory. Runs without a match are left out.
     """
+    global SINGLE_RUN_LOG_SCANS
     if not hydra_single_run_root or not os.path.isdir(hydra_single_run_root):
         app.logger.debug(f"Single-run Hydra override search: hydra_single_run_root '{hydra_single_run_root}' is not a valid directory.")
+        return {}
+    names_key = frozenset(run_names)
+    pending_run_names = set(names_key)
+    find_run_names = _build_run_name_matcher(names_key)
+    previous_scans, current_scans = SINGLE_RUN_LOG_SCANS, {}
+    job_dirs_by_run = {}
+
+    # Collect the logs (*.log) of every job output directory, in directory order:
+    # date-stamped directories (e.g., YYYY-MM-DD), then time-stamped job output directories (e.g., HH-MM-SS).
+    # Directories without .hydra are read too: skipping them would let a later, unrelated job claim the run.
+    logs_by_job_dir = []
+    with os.scandir(hydra_single_run_root) as date_it:
+        date_dirs = [entry.path for entry in date_it if entry.is_dir()]
+    for date_dir in date_dirs:
+        try:
+            with os.scandir(date_dir) as job_it:
+                hydra_job_output_dirs = [entry.path for entry in job_it if entry.is_dir()]
+        except OSError as e_scan:
+            app.logger.warning(f"Single-run search: Could not scan directory {date_dir}: {e_scan}")
+            continue
+        for hydra_job_output_dir in hydra_job_output_dirs:
+            try:
+                with os.scandir(hydra_job_output_dir) as log_it:
+                    job_entries = list(log_it)
+            except OSError as e_scan:
+                app.logger.warning(f"Single-run search: Could not scan directory {hydra_job_output_dir}: {e_scan}")
+                continue
+            log_files = [entry.path for entry in job_entries if entry.name.endswith('.log') and entry.is_file()]
+            if log_files:
+                logs_by_job_dir.append((hydra_job_output_dir, log_files))
+
+    found_by_log = _scan_logs_for_run_names(
+        [log_file for _, log_files in logs_by_job_dir for log_file in log_files],
+        200 * 1024, find_run_names, names_key, previous_scans, current_scans # Check first 200KB
+    )
+    for hydra_job_output_dir, log_files in logs_by_job_dir:
+        if not pending_run_names:
+            break
+        found_run_names = set()
+        for log_file in log_files:
+            found_run_names |= found_by_log.get(log_file, set()) & pending_run_names
+        for run_name in found_run_names:
+            app.logger.info(f"Single-run search: Found search term for TB run '{run_name}' in Hydra logs of: {hydra_job_output_dir}")
+            job_dirs_by_run[run_name] = Path(hydra_job_output_dir)
+        pending_run_names -= found_run_names
+
+    SINGLE_RUN_LOG_SCANS = current_scans
+    return job_dirs_by_run
+
+def find_hydra_overrides_single_run(tb_run_name, hydra_job_output_dir):
+    """
+    Reads the Hydra overrides.yaml, or config.yaml as a fallback, of a 'normal' Hydra job.
+
+    Args:
+        tb_run_name (str): The directory name of the TensorBoard run.
+        hydra_job_output_dir (Path): The job output directory whose logs mention the run,
+                                     from index_hydra_single_run_logs.
+
+    Returns:
+        str | None: Content of overrides.yaml or config.yaml, or None if not found.
+    """
+    remembered_content = _remembered_overrides(tb_run_name, hydra_job_output_dir)
+    if remembered_content is not None:
+        return remembered_content
+
+    # Look for .hydra/overrides.yaml or .hydra/config.yaml within the job output directory.
+    hydra_config_subdir = hydra_job_output_dir / ".hydra"
+
+    overrides_file = hydra_config_subdir / "overrides.yaml"
+    try:
+        content = _read_overrides(tb_run_name, hydra_job_output_dir, overrides_file)
+        app.logger.info(f"Single-run search: Found Hydra overrides.yaml for TB run '{tb_run_name}' at: {overrides_file}")
+        return content
+    except FileNotFoundError: pass # Fall back to config.yaml
+    except Exception as e_read_yaml: app.logger.error(f"Single-run search: Error reading overrides file {overrides_file}: {e_read_yaml}"); return None
+
+    config_yaml_file = hydra_config_subdir / "config.yaml" 
+    if config_yaml_file.is_file():
+        app.logger.info(f"Single-run search: Found Hydra config.yaml (as fallback) for TB run '{tb_run_name}' at: {config_yaml_file}")
+        try: return config_yaml_file.read_text(encoding='utf-8')
+        except Exception as e_read_yaml: app.logger.error(f"Single-run search: Error reading config.yaml file {config_yaml_file}: {e_read_yaml}"); return None
+
+    # Log match found, but neither overrides.yaml nor config.yaml exists in .hydra for this candidate
+    app.logger.warning(f"Single-run search: Log match for '{tb_run_name}' in {hydra_job_output_dir}, "
+                       f"but no .hydra/overrides.yaml or .hydra/config.yaml found.")
+    return None
+
+# --- Event File Reader ---
+HPARAMS_SESSION_START_TAG = "_hparams_/session_start_info"
+RECORD_LENGTH_STRUCT = struct.Struct('<Q')
+RECORD_CRC_STRUCT = struct.Struct('<I')
+RECORD_HEADER_SIZE = 12 # uint64 length + uint32 masked CRC of the length
+RECORD_FOOTER_SIZE = 4 # uint32 masked CRC of the data
+CRC_MASK_DELTA = 0xa282ead8
+PARSE_POOL = None # Worker processes for read_event_files, created lazily and reused across refreshes
+VERIFY_EVENT_CRC = google_crc32c is not None # Verify record CRCs when a fast CRC32C implementation is available
+EVENT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "p-board") # Parsed event files; None disables the cache
+EVENT_CACHE_VERSION = 2 # Bump when the layout of cache entries changes
+
+def find_event_files(log_root_dir):
+    """
+    Recursively lists the TensorBoard event files below a log directory.
+
+    Args:
+        log_root_dir (str): The absolute path to the main log directory.
+
+    Returns:
+        list[tuple[str, str]]: (dir_name, file_path) pairs sorted by path. dir_name is the directory
+                               of the event file relative to log_root_dir ('' for log_root_dir itself).
+    """
+    event_files = []
+    pending_dirs = [(log_root_dir, "")]
+    while pending_dirs:
+        dir_path, dir_name = pending_dirs.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        pending_dirs.append((entry.path, f"{dir_name}/{entry.name}" if dir_name else entry.name))
+                    elif "tfevents" in entry.name and entry.is_file():
+                        event_files.append((dir_name, entry.path))
+        except OSError as e_scan:
+            app.logger.warning(f"Could not scan directory {dir_path} for event files: {e_scan}")
+    event_files.sort(key=lambda item: item[1])
+    return event_files
+
+def masked_crc32c(data):
+    """Computes the masked CRC32C that TFRecord framing stores for the length and the data of each record."""
+    crc = google_crc32c.value(data)
+    return ((((crc >> 15) | (crc << 17)) & 0xffffffff) + CRC_MASK_DELTA) & 0xffffffff
+
+def read_event_file(file_path, verify_crc=False, start_offset=0):
+    """
+    Parses the scalar and HParams summaries of a single tfevents file.
+
+    Records are framed as a uint64 length, a uint32 masked CRC of the length, the serialized
+    Event proto and a uint32 masked CRC of the data. A truncated record at the end of the
+    file (a run that is still writing) is ignored.
+
+    Args:
+        file_path (str): Path to the event file.
+        verify_crc (bool): Check both record CRCs (requires google-crc32c). Reading stops at the
+                           first corrupt record, like TensorBoard's own reader. Without it, reading
+                           still stops at the first record that does not decode.
+        start_offset (int): Byte offset of the first record to read, to parse only what was appended.
+
+    Returns:
+        dict: {'scalars': {tag: (steps, values, wall_times)}, 'hparams': [(wall_time, {name: value})],
+               'end_offset': int}. steps/values/wall_times are int64/float32/float64 numpy arrays in
+              file order; end_offset is where the next unread record starts.
+    """
+    scalar_buffers = {} # tag -> (steps, values, wall_times) typed arrays, appended in file order
+    hparam_entries = []
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size <= start_offset:
+            return {'scalars': {}, 'hparams': hparam_entries, 'end_offset': start_offset} # mmap rejects empty files
+        # Records are sliced straight out of the page cache instead of a heap copy of the whole file
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Runs once per record and once per summary value, so look up everything it needs only once
+    unpack_length = RECORD_LENGTH_STRUCT.unpack_from
+    parse_event = event_pb2.Event.FromString
+    offset, data_len = start_offset, len(data)
+    with data:
+        while offset + RECORD_HEADER_SIZE <= data_len:
+            (record_len,) = unpack_length(data, offset)
+            record_end = offset + RECORD_HEADER_SIZE + record_len + RECORD_FOOTER_SIZE
+            if record_end > data_len:
+                break # Partially written record
+            payload = data[offset + RECORD_HEADER_SIZE:record_end - RECORD_FOOTER_SIZE]
+            if verify_crc:
+                (length_crc,) = RECORD_CRC_STRUCT.unpack_from(data, offset + 8)
+                (payload_crc,) = RECORD_CRC_STRUCT.unpack_from(data, record_end - RECORD_FOOTER_SIZE)
+                if length_crc != masked_crc32c(data[offset:offset + 8]) or payload_crc != masked_crc32c(payload):
+                    app.logger.warning(f"CRC mismatch in event file {file_path} at offset {offset}; ignoring the rest of the file.")
+                    break
+            try:
+                event = parse_event(payload)
+            except DecodeError as e_decode: # Corrupt record that no CRC check caught (verification is opt-in)
+                app.logger.warning(f"Undecodable record in event file {file_path} at offset {offset} ({e_decode}); ignoring the rest of the file.")
+                break
+            offset = record_end
+            if not event.HasField('summary'):
+                continue
+            step, wall_time = event.step, event.wall_time # Each access builds a new Python object
+            for value in event.summary.value:
+                if value.HasField('simple_value'):
+                    tag = value.tag
+                    buffers = scalar_buffers.get(tag)
+                    if buffers is None:
+                        buffers = scalar_buffers[tag] = (array('q'), array('f'), array('d'))
+                    buffers[0].append(step)
+                    buffers[1].append(value.simple_value)
+                    buffers[2].append(wall_time)
+                elif value.tag == HPARAMS_SESSION_START_TAG and value.metadata.plugin_data.plugin_name == 'hparams':
+                    plugin_data = plugin_data_pb2.HParamsPluginData.FromString(value.metadata.plugin_data.content)
+                    hparams = {}
+                    for name, hparam_value in plugin_data.session_start_info.hparams.items():
+                        kind = hparam_value.WhichOneof('kind')
+                        if kind in ('number_value', 'string_value', 'bool_value'):
+                            hparams[name] = getattr(hparam_value, kind)
+                    hparam_entries.append((event.wall_time, hparams))
+
+    scalars = {
+        tag: (np.frombuffer(steps, dtype=np.int64), np.frombuffer(values, dtype=np.float32), np.frombuffer(wall_times, dtype=np.float64))
+        for tag, (steps, values, wall_times) in scalar_buffers.items()
+    }
+    return {'scalars': scalars, 'hparams': hparam_entries, 'end_offset': offset}
+
+def _event_cache_prefix(cache_dir, file_path):
+    return os.path.join(cache_dir, hashlib.sha1(file_path.encode()).hexdigest())
+
+def _event_cache_column_path(cache_prefix, token, column):
+    return f"{cache_prefix}.{token}.{column}.npy"
+
+def load_event_cache_meta(cache_prefix, file_path):
+    """
+    Reads the metadata of a cache entry written by save_cached_event_file.
+
+    Returns:
+        dict | None: The metadata ('size', 'mtime_ns', 'end_offset', 'tags', 'tag_offsets', 'hparams',
+                     'token'), or None if there is no usable entry for file_path.
+    """
+    try:
+        with open(f"{cache_prefix}.json", 'rb') as f:
+            meta = orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e_load:
+        app.logger.debug(f"Ignoring unreadable event cache entry {cache_prefix}.json: {e_load}")
         return None
+    if meta.get('version') != EVENT_CACHE_VERSION or meta.get('path') != file_path:
+        return None
+    return meta
 
-    search_term = tb_run_name # This is the dir_name from tbparse
-    app.logger.debug(f"Single-run Hydra override search for TB run '{tb_run_name}' "
-                     f"using search term '{search_term}' in Hydra root '{hydra_single_run_root}' "
-                     f"(expected structure: DATE_DIR/TIME_DIR/*.log)")
+def load_cached_event_file(cache_prefix, meta):
+    """
+    Loads a cache entry as a read_event_file result whose arrays are read-only memory maps.
+    Pages are shared through the page cache instead of being copied into each process.
 
-    hydra_root_path = Path(hydra_single_run_root)
+    Returns:
+        dict: Same as read_event_file.
+    """
+    # Plain ndarray views of the maps (orjson rejects the np.memmap subclass); they keep the maps alive
+    columns = [
+        np.load(_event_cache_column_path(cache_prefix, meta['token'], column), mmap_mode='r').view(np.ndarray)
+        for column in ('steps', 'values', 'wall_times')
+    ]
+    tag_offsets = meta['tag_offsets']
+    scalars = {
+        tag: tuple(column[tag_offsets[idx]:tag_offsets[idx + 1]] for column in columns)
+        for idx, tag in enumerate(meta['tags'])
+    }
+    hparam_entries = [(wall_time, hparams) for wall_time, hparams in meta['hparams']]
+    return {'scalars': scalars, 'hparams': hparam_entries, 'end_offset': meta['end_offset']}
+
+def save_cached_event_file(cache_prefix, file_path, parsed_file, file_stat, previous_meta=None):
+    """
+    Writes a read_event_file result to the cache: one .npy file per column with the series of
+    all tags back to back, plus a JSON file with the metadata and the per-tag offsets.
+
+    The .npy files carry a fresh token in their name and the JSON file is replaced last, so
+    readers (including ones still mapping an older version) never see a half-written entry.
+    """
+    tags = list(parsed_file['scalars'])
+    series = [parsed_file['scalars'][tag] for tag in tags]
+    tag_offsets = [0]
+    for steps, _, _ in series:
+        tag_offsets.append(tag_offsets[-1] + len(steps))
+    os.makedirs(os.path.dirname(cache_prefix), exist_ok=True)
+
+    token = f"{os.getpid()}-{time.time_ns()}"
+    for column_idx, (column, dtype) in enumerate((('steps', np.int64), ('values', np.float32), ('wall_times', np.float64))):
+        column_data = np.concatenate([parts[column_idx] for parts in series]) if series else np.empty(0, dtype=dtype)
+        np.save(_event_cache_column_path(cache_prefix, token, column), column_data)
+    meta = {
+        'version': EVENT_CACHE_VERSION,
+        'path': file_path,
+        'size': file_stat.st_size,
+        'mtime_ns': file_stat.st_mtime_ns,
+        'end_offset': parsed_file['end_offset'],
+        'token': token,
+        'tags': tags,
+        'tag_offsets': tag_offsets,
+        'hparams': parsed_file['hparams'],
+    }
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_prefix), suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(meta))
+        os.replace(tmp_path, f"{cache_prefix}.json")
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    if previous_meta is not None:
+        for column in ('steps', 'values', 'wall_times'):
+            try:
+                os.unlink(_event_cache_column_path(cache_prefix, previous_meta['token'], column))
+            except OSError:
+                pass # Already gone, or still mapped on a platform that does not allow unlinking it
 
-    # Iterate through date-stamped directories (e.g., YYYY-MM-DD)
-    for date_dir in hydra_root_path.iterdir():
-        if not date_dir.is_dir():
+def prune_event_cache(cache_dir, log_root_dir, event_files):
+    """
+    Removes the cache entries of event files below log_root_dir that are no longer there.
+
+    Entries of other log directories are left alone, since the cache directory is shared between
+    them. Only entries that do not belong to a current event file have their metadata read.
+
+    Args:
+        cache_dir (str): The event cache directory.
+        log_root_dir (str): The log directory that was just scanned.
+        event_files (list[tuple[str, str]]): (dir_name, file_path) pairs from find_event_files.
+
+    Returns:
+        int: Number of entries removed.
+    """
+    current_keys = {os.path.basename(_event_cache_prefix(cache_dir, file_path)) for _, file_path in event_files}
+    log_root_prefix = os.path.join(log_root_dir, '')
+    names_by_key = defaultdict(list) # sha1 of the event file path -> names of its .json/.npy files
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                names_by_key[entry.name.partition('.')[0]].append(entry.name)
+    except FileNotFoundError:
+        return 0
+
+    removed_count = 0
+    for key, names in names_by_key.items():
+        if key in current_keys or f"{key}.json" not in names:
+            continue
+        try:
+            with open(os.path.join(cache_dir, f"{key}.json"), 'rb') as f:
+                cached_path = orjson.loads(f.read()).get('path')
+        except Exception:
+            continue # Being replaced, or not ours to judge
+        if not isinstance(cached_path, str) or not cached_path.startswith(log_root_prefix):
             continue
+        for name in names: # The metadata and every column token, including ones left by an interrupted write
+            try:
+                os.unlink(os.path.join(cache_dir, name))
+            except OSError:
+                pass # Still mapped on a platform that does not allow unlinking it; retried next refresh
+        removed_count += 1
+    return removed_count
 
-        # Iterate through time-stamped directories (e.g., HH-MM-SS)
-        # These are the actual Hydra job output directories
-        for hydra_job_output_dir in date_dir.iterdir():
-            if not hydra_job_output_dir.is_dir():
-                continue
+def read_event_file_cached(file_path, verify_crc=False, cache_dir=None, load_result=True):
+    """
+    read_event_file with an on-disk cache keyed on the file's (path, size, mtime).
 
-            app.logger.debug(f"Single-run search: Checking potential Hydra job output directory: {hydra_job_output_dir}")
-
-            # Look for common log files (e.g., *.log) within this hydra_job_output_dir
-            log_files_to_check = list(hydra_job_output_dir.glob('*.log'))
-            if not log_files_to_check:
-                app.logger.debug(f"Single-run search: No '*.log' files found in {hydra_job_output_dir}")
-                continue # Move to the next hydra_job_output_dir
-
-            found_in_log = False
-            for log_file in log_files_to_check:
-                # Path.glob should yield files, but an explicit check is safe.
-                if log_file.is_file():
-                    try:
-                        content_to_check = ""
-                        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                            content_to_check = f.read(200 * 1024) # Check first 200KB
-
-                        if search_term in content_to_check:
-                            app.logger.info(f"Single-run search: Found search term '{search_term}' for TB run '{tb_run_name}' "
-                                            f"in Hydra log file: {log_file}")
-                            found_in_log = True
-                            break # Found the term, proceed with this hydra_job_output_dir
-                    except Exception as e_read:
-                        app.logger.warning(f"Single-run search: Could not read or search log file {log_file}: {e_read}")
-                        # Continue to the next log file if this one fails
-                        continue
-            
-            if found_in_log:
-                # If the search term was found, this hydra_job_output_dir is our candidate.
-                # Look for .hydra/overrides.yaml or .hydra/config.yaml within it.
-                hydra_config_subdir = hydra_job_output_dir / ".hydra"
-                
-                overrides_file = hydra_config_subdir / "overrides.yaml"
-                if overrides_file.is_file():
-                    app.logger.info(f"Single-run search: Found Hydra overrides.yaml for TB run '{tb_run_name}' at: {overrides_file}")
-                    try: return overrides_file.read_text(encoding='utf-8')
-                    except Exception as e_read_yaml: app.logger.error(f"Single-run search: Error reading overrides file {overrides_file}: {e_read_yaml}"); return None
-
-                config_yaml_file = hydra_config_subdir / "config.yaml" 
-                if config_yaml_file.is_file():
-                    app.logger.info(f"Single-run search: Found Hydra config.yaml (as fallback) for TB run '{tb_run_name}' at: {config_yaml_file}")
-                    try: return config_yaml_file.read_text(encoding='utf-8')
-                    except Exception as e_read_yaml: app.logger.error(f"Single-run search: Error reading config.yaml file {config_yaml_file}: {e_read_yaml}"); return None
-
-                # Log match found, but neither overrides.yaml nor config.yaml exists in .hydra for this candidate
-                app.logger.warning(f"Single-run search: Log match for '{tb_run_name}' in {hydra_job_output_dir}, "
-                                   f"but no .hydra/overrides.yaml or .hydra/config.yaml found.")
-                return None # This candidate, despite log match, didn't have the required Hydra files
-
-    # If loops complete without finding a log file containing the search term in the expected structure
-    app.logger.debug(f"Single-run search: No Hydra job output directory in '{hydra_root_path}' "
-                     f"(with structure DATE_DIR/TIME_DIR/*.log) found whose logs contain the term '{search_term}' "
-                     f"for TB run '{tb_run_name}'.")
-    return None
+    Unchanged files are loaded from the cache. When a file only grew (a run that is still
+    writing), just the records after the cached end offset are parsed and appended.
+
+    Args:
+        file_path (str): Path to the event file.
+        verify_crc (bool): Passed through to read_event_file.
+        cache_dir (str | None): Directory holding the cache entries. None disables caching.
+        load_result (bool): If False, return None instead of the result whenever the cache entry
+                            is up to date, so a worker process does not send arrays the parent can
+                            map from the cache itself.
+
+    Returns:
+        dict | None: Same as read_event_file, or None (see load_result).
+    """
+    if cache_dir is None:
+        return read_event_file(file_path, verify_crc)
+    file_stat = os.stat(file_path)
+    cache_prefix = _event_cache_prefix(cache_dir, file_path)
+    meta = load_event_cache_meta(cache_prefix, file_path)
+    if meta is not None and meta['size'] == file_stat.st_size and meta['mtime_ns'] == file_stat.st_mtime_ns:
+        return load_cached_event_file(cache_prefix, meta) if load_result else None
+
+    if meta is not None and meta['size'] < file_stat.st_size:
+        cached = load_cached_event_file(cache_prefix, meta)
+        tail = read_event_file(file_path, verify_crc, start_offset=cached['end_offset'])
+        scalars = dict(cached['scalars'])
+        for tag, series in tail['scalars'].items():
+            if tag in scalars:
+                scalars[tag] = tuple(np.concatenate(columns) for columns in zip(scalars[tag], series))
+            else:
+                scalars[tag] = series
+        parsed_file = {'scalars': scalars, 'hparams': cached['hparams'] + tail['hparams'], 'end_offset': tail['end_offset']}
+    else:
+        parsed_file = read_event_file(file_path, verify_crc)
+
+    try:
+        save_cached_event_file(cache_prefix, file_path, parsed_file, file_stat, previous_meta=meta)
+    except OSError as e_save:
+        app.logger.debug(f"Could not write event cache entry for {file_path}: {e_save}")
+        return parsed_file
+    return parsed_file if load_result else None
+
+def load_event_file_from_cache(file_path, cache_dir):
+    """Maps the up-to-date cache entry of file_path, as left behind by read_event_file_cached(load_result=False)."""
+    cache_prefix = _event_cache_prefix(cache_dir, file_path)
+    meta = load_event_cache_meta(cache_prefix, file_path)
+    if meta is None:
+        raise FileNotFoundError(f"No event cache entry for {file_path}")
+    return load_cached_event_file(cache_prefix, meta)
+
+def get_parse_pool():
+    """Returns the shared process pool for event file parsing, creating it on first use."""
+    global PARSE_POOL
+    if PARSE_POOL is None:
+        # Never fork: by now this process runs the waitress, follower and refresh threads, and a
+        # forked child would inherit whatever locks they held. forkserver forks a clean helper instead.
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context(start_method))
+    return PARSE_POOL
+
+def read_event_files(file_paths):
+    """
+    Parses several event files, fanning them out over worker processes when there is more than one.
+    Protobuf decoding holds the GIL, so processes (not threads) are needed to use more than one core.
+
+    Args:
+        file_paths (list[str]): Paths to the event files.
+
+    Returns:
+        list[dict | None]: read_event_file_cached results in the order of file_paths, None for files that failed.
+    """
+    global PARSE_POOL
+    results = [None] * len(file_paths)
+    pending_indices = list(range(len(file_paths)))
+
+    if len(file_paths) > 1 and (os.cpu_count() or 1) > 1:
+        try:
+            # With the disk cache enabled, workers leave their results in the cache and return None;
+            # mapping the cached arrays here avoids pickling every array back through a pipe.
+            futures = [
+                get_parse_pool().submit(read_event_file_cached, file_path, VERIFY_EVENT_CRC, EVENT_CACHE_DIR, False)
+                for file_path in file_paths
+            ]
+            pending_indices = []
+            for idx, future in enumerate(futures):
+                try:
+                    results[idx] = future.result()
+                    if results[idx] is None:
+                        results[idx] = load_event_file_from_cache(file_paths[idx], EVENT_CACHE_DIR)
+                except BrokenProcessPool:
+                    raise
+                except FileNotFoundError:
+                    pending_indices.append(idx) # Cache entry replaced concurrently; parse it here instead
+                except Exception as e_read:
+                    app.logger.warning(f"Could not read event file {file_paths[idx]}: {e_read}")
+        except BrokenProcessPool:
+            app.logger.warning("Event file parsing pool broke down; parsing the remaining files in-process.")
+            PARSE_POOL.shutdown(wait=False) # A broken pool fails its pending futures on its own
+            PARSE_POOL = None
+            pending_indices = [idx for idx, result in enumerate(results) if result is None]
+
+    for idx in pending_indices:
+        try:
+            results[idx] = read_event_file_cached(file_paths[idx], VERIFY_EVENT_CRC, EVENT_CACHE_DIR)
+        except Exception as e_read:
+            app.logger.warning(f"Could not read event file {file_paths[idx]}: {e_read}")
+    return results
+
+def merge_scalar_series(series_parts):
+    """
+    Combines the per-file parts of one run/tag series into a cache entry.
+
+    Args:
+        series_parts (list[tuple]): (steps, values, wall_times) array triples, one per event file.
+
+    Returns:
+        dict | None: {'steps', 'values', 'wall_times'} numpy arrays sorted by step,
+                     or None if no finite points remain.
+    """
+    if len(series_parts) == 1:
+        steps, values, wall_times = series_parts[0]
+    else:
+        steps, values, wall_times = (np.concatenate(column) for column in zip(*series_parts))
+
+    # np.isfinite rejects NaN and +/-Inf in a single vectorized pass
+    finite_mask = np.isfinite(values) & np.isfinite(wall_times)
+    if not finite_mask.all():
+        steps, values, wall_times = steps[finite_mask], values[finite_mask], wall_times[finite_mask]
+    if len(steps) == 0:
+        return None
+
+    # Event files are written in step order, so only sort (stably) when they are not
+    if len(steps) > 1 and not (steps[1:] >= steps[:-1]).all():
+        order = np.argsort(steps, kind='stable')
+        steps, values, wall_times = steps[order], values[order], wall_times[order]
+
+    # Steps nearly always fit in int32, which halves their footprint; keep int64 when they do not
+    int32_info = np.iinfo(np.int32)
+    if steps[0] >= int32_info.min and steps[-1] <= int32_info.max:
+        steps = steps.astype(np.int32)
+    return {"steps": steps, "values": values, "wall_times": wall_times}
+
+def encode_scalar_series(tag_entry):
+    """
+    Encodes a cache entry as the JSON sent by /api/data.
+
+    Steps are sent as the first step plus the differences between consecutive steps. Those are
+    small, repetitive integers (usually the logging interval), which take a fraction of the bytes
+    of absolute steps before and after compression. The frontend rebuilds the steps array.
+
+    Args:
+        tag_entry (dict): {'steps', 'values', 'wall_times'} numpy arrays from merge_scalar_series.
+
+    Returns:
+        bytes: {"first_step": int, "step_deltas": [...], "values": [...], "wall_times": [...]} as JSON.
+    """
+    steps = tag_entry["steps"]
+    return orjson.dumps({
+        "first_step": int(steps[0]),
+        "step_deltas": np.diff(steps.astype(np.int64, copy=False)), # int64 so large step gaps cannot overflow
+        "values": tag_entry["values"],
+        "wall_times": tag_entry["wall_times"],
+    }, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def downsample_scalar_series(tag_entry, target_points):
+    """
+    Picks target_points points of a series with Largest-Triangle-Three-Buckets (LTTB).
+
+    The first and last points are kept; every other point is taken from one of target_points - 2
+    equally sized buckets, as the one spanning the largest triangle with the point picked from the
+    previous bucket and the mean of the next bucket. Spikes survive, unlike with plain striding.
+
+    Args:
+        tag_entry (dict): {'steps', 'values', 'wall_times'} numpy arrays from merge_scalar_series.
+        target_points (int): Number of points to keep (at least 3).
+
+    Returns:
+        dict: A cache entry of the same shape holding the selected points.
+    """
+    x = tag_entry["steps"].astype(np.float64)
+    y = tag_entry["values"].astype(np.float64)
+    point_count = len(x)
+    bucket_edges = (np.arange(target_points - 1) * ((point_count - 2) / (target_points - 2))).astype(np.int64) + 1
+    bucket_edges[-1] = point_count - 1
+    bucket_sizes = np.diff(bucket_edges)
+    # Means of all buckets up front; bucket i is scored against the mean of bucket i + 1 (or the last point)
+    mean_x = np.append(np.add.reduceat(x[:-1], bucket_edges[:-1]) / bucket_sizes, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:-1], bucket_edges[:-1]) / bucket_sizes, y[-1])
+
+    selected = np.empty(target_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, point_count - 1
+    anchor = 0
+    for bucket_idx in range(target_points - 2):
+        start, end = bucket_edges[bucket_idx], bucket_edges[bucket_idx + 1]
+        anchor_x, anchor_y = x[anchor], y[anchor]
+        next_x, next_y = mean_x[bucket_idx + 1], mean_y[bucket_idx + 1]
+        # Twice the triangle area; the constant factor does not change the argmax
+        areas = np.abs((anchor_x - next_x) * (y[start:end] - anchor_y) - (anchor_x - x[start:end]) * (next_y - anchor_y))
+        anchor = start + int(areas.argmax())
+        selected[bucket_idx + 1] = anchor
+    return {column: tag_entry[column][selected] for column in ("steps", "values", "wall_times")}
+
+def encode_downsampled_series(tag_entry):
+    """
+    Encodes the ?resolution=low variant of a cache entry for /api/data, on first use.
+
+    The result is memoized on the entry itself. Entries are replaced rather than modified when a
+    series changes, so the memo never outlives the data it was built from, and series nobody
+    requests at low resolution never pay for it.
+
+    Args:
+        tag_entry (dict): {'steps', 'values', 'wall_times'} numpy arrays from merge_scalar_series.
+
+    Returns:
+        bytes | None: encode_scalar_series JSON of the LTTB-downsampled series, or None if the
+                      series has at most DOWNSAMPLE_THRESHOLD_POINTS points and is served in full.
+    """
+    if len(tag_entry["steps"]) <= DOWNSAMPLE_THRESHOLD_POINTS:
+        return None
+    downsampled_json = tag_entry.get("downsampled_json")
+    if downsampled_json is None: # Concurrent first requests may both encode; either result is the same
+        downsampled_json = tag_entry["downsampled_json"] = encode_scalar_series(downsample_scalar_series(tag_entry, DOWNSAMPLE_TARGET_POINTS))
+    return downsampled_json
+
+def load_event_data(event_files, event_fingerprint=(), previous_scalar_runs=None):
+    """
+    Builds cache entries holding the scalars and TensorBoard hparams of every run (steps 1-7 of a refresh).
+
+    Merging and encoding the scalars is most of a refresh's work once event files come from the
+    on-disk cache, so runs whose event files are all unchanged reuse the previous refresh's result.
+
+    Args:
+        event_files (list[tuple[str, str]]): (dir_name, file_path) pairs from find_event_files.
+        event_fingerprint (tuple): (path, size, mtime_ns) per event file, from _event_files_fingerprint.
+        previous_scalar_runs (dict | None): The scalar_runs returned by the previous call.
+
+    Returns:
+        tuple: (temp_cache, runs_to_keep, tracked_event_files, scalar_runs). temp_cache maps every
+               candidate run to an entry without Hydra overrides, runs_to_keep holds the runs that have
+               scalars or hparams, and tracked_event_files is the start state for follow_event_files.
+               scalar_runs maps each run with scalars to (its event file fingerprints, 'scalars',
+               'scalars_json'), for the next call.
+    """
+    temp_cache = {} # Build data into a temporary dictionary
+    file_stats = {file_path: (file_size, mtime_ns) for file_path, file_size, mtime_ns in event_fingerprint}
+    run_file_keys = {} # run_name -> ((path, size, mtime_ns), ...) of its event files
+    for dir_name, file_path in event_files:
+        run_file_keys.setdefault(dir_name, []).append((file_path,) + file_stats.get(file_path, ()))
+    previous_scalar_runs = previous_scalar_runs or {}
+    scalar_runs = {}
+    read_start_time = time.time()
+    scalar_parts_by_run = {} # Maps run_name -> {tag: [(steps, values, wall_times), ...]}, one part per event file
+    hparam_base_run_map = defaultdict(list) # Maps base_run_name to list of (wall_time, hparams) entries
+    parsed_files = read_event_files([file_path for _, file_path in event_files])
+    tracked_event_files = {}
+    for (dir_name, file_path), parsed_file in zip(event_files, parsed_files):
+        if parsed_file is None:
+            continue # Already logged by read_event_files
+        tracked_event_files[file_path] = {'run': dir_name, 'size': parsed_file['end_offset'], 'end_offset': parsed_file['end_offset']}
+        if parsed_file['scalars']:
+            run_parts = scalar_parts_by_run.setdefault(dir_name, {})
+            for tag, series in parsed_file['scalars'].items():
+                run_parts.setdefault(tag, []).append(series)
+        for hparam_entry in parsed_file['hparams']:
+            # dir_name is e.g. "actual_run_name/hparam_timestamp"; derive base run name (e.g., "actual_run_name")
+            base_run_name = dir_name.partition('/')[0] # find_event_files always joins dir_name with '/'
+            hparam_base_run_map[base_run_name].append(hparam_entry)
+    read_duration = time.time() - read_start_time
+    app.logger.info(f"Background Refresh: Read scalars/hparams from event files in {read_duration:.2f}s.")
+
+    # 2. Collect all unique base run directory names
+    all_base_run_names = set(scalar_parts_by_run)
+    all_base_run_names.update(hparam_base_run_map)
+
+    # 3. If no runs from TB, but Hydra dir is set, check LOG_ROOT_DIR subdirs
+    if not all_base_run_names and HYDRA_MULTIRUN_DIR:
+        app.logger.info("Background Refresh: No TensorBoard data found. Checking LOG_ROOT_DIR subdirectories for potential Hydra overrides.")
+        try:
+            # os.scandir reuses the d_type from readdir, so is_dir() needs no extra stat per entry
+            with os.scandir(LOG_ROOT_DIR) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        all_base_run_names.add(entry.name)
+        except Exception as e_dir_list:
+            app.logger.error(f"Background Refresh: Error listing directories in {LOG_ROOT_DIR} for override check: {e_dir_list}")
+
+    if not all_base_run_names:
+        return temp_cache, set(), tracked_event_files, scalar_runs
+
+    # 4. Initialize temp_cache for all identified base run names
+    for run_name in all_base_run_names:
+        temp_cache[run_name] = {
+            'scalars': {},
+            'scalars_json': {}, # tag -> pre-encoded JSON of the 'scalars' entry, served by /api/data
+            'hydra_overrides': None,
+            'hparams': None  # Initialize hparams entry
+        }
+    app.logger.info(f"Background Refresh: Identified {len(all_base_run_names)} potential runs to process.")
+
+    # 5. Process scalars
+    if scalar_parts_by_run:
+        app.logger.info(f"Background Refresh: Processing scalar data for {len(scalar_parts_by_run)} runs...")
+        dropped_series_count = 0
+        reused_runs_count = 0
+        for run_name, tag_parts in scalar_parts_by_run.items():
+            file_keys = tuple(run_file_keys[run_name])
+            previous_run = previous_scalar_runs.get(run_name)
+            if previous_run is not None and previous_run[0] == file_keys:
+                _, run_scalars, run_scalars_json = previous_run # Same event files, same sizes and mtimes
+                reused_runs_count += 1
+            else:
+                merged_series = {tag: merge_scalar_series(series_parts) for tag, series_parts in tag_parts.items()}
+                run_scalars = {tag: tag_entry for tag, tag_entry in merged_series.items() if tag_entry is not None}
+                dropped_series_count += len(merged_series) - len(run_scalars)
+                # Encode once here; /api/data then only concatenates bytes
+                run_scalars_json = {tag: encode_scalar_series(tag_entry) for tag, tag_entry in run_scalars.items()}
+            temp_cache[run_name]['scalars'] = run_scalars
+            temp_cache[run_name]['scalars_json'] = run_scalars_json
+            scalar_runs[run_name] = (file_keys, run_scalars, run_scalars_json)
+        if reused_runs_count > 0:
+            app.logger.info(f"Background Refresh: Reused the scalars of {reused_runs_count} runs with unchanged event files.")
+        if dropped_series_count > 0:
+            app.logger.debug(f"Background Refresh: Dropped {dropped_series_count} scalar series with no finite values.")
+    else:
+        app.logger.info("Background Refresh: No scalar data found in event files.")
+
+    # 6. Initialize a set to keep track of runs that have any data (scalars, hparams, or overrides)
+    runs_to_keep = set()
+
+    # Populate runs_to_keep based on SCALARS processed earlier
+    for run_name, data in temp_cache.items():
+        if data.get('scalars') and data['scalars']: # Check for non-empty scalars dict
+            runs_to_keep.add(run_name)
+
+    # 7. Process HParams (using hparam_base_run_map)
+    if hparam_base_run_map:
+        app.logger.info(f"Background Refresh: Processing TensorBoard HParams for {len(hparam_base_run_map)} base runs...")
+        for base_run_name, hparam_entries_for_run in hparam_base_run_map.items():
+            if base_run_name in temp_cache and temp_cache[base_run_name]['hparams'] is None and hparam_entries_for_run:
+                hparam_dict_to_store = {}
+                metric_dict_to_store = {} # Reflects metric_dict={} in add_hparams call
+
+                # Apply entries in wall_time order, so the most recent session wins for repeated keys
+                for _, hparams in sorted(hparam_entries_for_run, key=lambda entry: entry[0]):
+                    hparam_dict_to_store.update(hparams)
+
+                if not hparam_dict_to_store:
+                    app.logger.warning(
+                        f"Background Refresh: Hparam events for run '{base_run_name}' did not yield "
+                        f"extractable name/value pairs, or were structured unexpectedly. "
+                        f"Number of hparam events: {len(hparam_entries_for_run)}."
+                    )
+
+                temp_cache[base_run_name]['hparams'] = {
+                    'hparam_dict': hparam_dict_to_store,
+                    'metric_dict': metric_dict_to_store
+                }
+                if hparam_dict_to_store: # If any hparams were actually stored
+                    runs_to_keep.add(base_run_name)
+                app.logger.debug(f"Background Refresh: Stored/updated TensorBoard hparams for run '{base_run_name}' from {len(hparam_entries_for_run)} event entries. HParams count: {len(hparam_dict_to_store)}, Metrics count: {len(metric_dict_to_store)}.")
+    else:
+        app.logger.info("Background Refresh: No TensorBoard hparam data found in event files.")
+
+    return temp_cache, runs_to_keep, tracked_event_files, scalar_runs
+
+def _event_files_fingerprint(event_files):
+    """(path, size, mtime_ns) of every event file; equal fingerprints mean no event data changed."""
+    fingerprint = []
+    for _, file_path in event_files:
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            continue # Removed since it was listed; read_event_files logs it
+        fingerprint.append((file_path, file_stat.st_size, file_stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+def _cache_contents_unchanged(published_cache, new_cache):
+    """
+    True if new_cache holds the same runs, scalars, hparams and overrides as published_cache.
+
+    Runs reused by load_event_data share their 'scalars_json' with the published entries, so
+    unchanged scalars are recognized by identity without comparing any arrays. A series the
+    follower extended has a new 'scalars_json', which counts as a change.
+    """
+    if published_cache.keys() != new_cache.keys():
+        return False
+    for run_name, run_entry in new_cache.items():
+        published_entry = published_cache[run_name]
+        if (published_entry['scalars_json'] is not run_entry['scalars_json']
+                or published_entry['hydra_overrides'] != run_entry['hydra_overrides']
+                or published_entry['hparams'] != run_entry['hparams']):
+            return False
+    return True
 
 # --- Preloading Function (Modified for Atomicity) ---
 def preload_all_runs_unified():
     """Loads scalar data and potentially Hydra overrides for ALL runs into a temporary cache,
        then atomically replaces the global cache."""
-    global RUN_DATA_CACHE, CACHE_LOAD_TIME, LOG_ROOT_DIR, HYDRA_MULTIRUN_DIR, HYDRA_SINGLE_RUN_LOG_DIR
+    global RUN_DATA_CACHE, RUNS_INFO_JSON, CACHE_LOAD_TIME, CACHE_UPDATED_AT, TRACKED_EVENT_FILES, LAST_EVENT_DATA, LOG_ROOT_DIR, HYDRA_MULTIRUN_DIR, HYDRA_SINGLE_RUN_LOG_DIR
     start_time = time.time()
     app.logger.info(f"--- Background Refresh: Starting unified data loading from: {LOG_ROOT_DIR} ---")
     if HYDRA_MULTIRUN_DIR:
@@ -295,170 +1220,51 @@ def preload_all_runs_unified():
         app.logger.info(f"--- Background Refresh: Skipped (invalid logdir). Duration: {load_duration:.2f}s ---")
         return
 
-    temp_cache = {} # Build data into a temporary dictionary
-
     try:
-        # 1. Initialize SummaryReader
-        app.logger.info(f"Background Refresh: Initializing SummaryReader for {LOG_ROOT_DIR}...")
-        reader = SummaryReader(
-            LOG_ROOT_DIR,
-            pivot=False, # Keep pivot=False for detailed scalar data
-            extra_columns={"wall_time", "dir_name"},
-            event_types={"scalars", "hparams"}, # For reader.scalars and reader.hparams
-        )
-        df_scalars = reader.scalars
-        df_hparams = reader.hparams # Accesses hparams data
-        tbparse_read_duration = time.time() - start_time
-        app.logger.info(f"Background Refresh: tbparse read scalars/hparams in {tbparse_read_duration:.2f}s.")
-
-        # 2. Collect all unique base run directory names
-        all_base_run_names = set()
-        if df_scalars is not None and not df_scalars.empty and 'dir_name' in df_scalars:
-            all_base_run_names.update(df_scalars['dir_name'].unique())
-
-        hparam_base_run_map = defaultdict(list) # Maps base_run_name to list of hparam rows
-        if df_hparams is not None and not df_hparams.empty and 'dir_name' in df_hparams:
-            # Sort by wall_time to pick the earliest hparam entry if multiple exist for the same base run
-            if 'wall_time' in df_hparams.columns:
-                df_hparams = df_hparams.sort_values('wall_time')
-            
-            for index, row in df_hparams.iterrows():
-                hparam_event_dir_name = row['dir_name'] # e.g., "actual_run_name/hparam_timestamp"
-                # Derive base run name (e.g., "actual_run_name")
-                base_run_name = Path(hparam_event_dir_name).parts[0]
-                all_base_run_names.add(base_run_name)
-                hparam_base_run_map[base_run_name].append(row)
-
-        # 3. If no runs from TB, but Hydra dir is set, check LOG_ROOT_DIR subdirs
-        if not all_base_run_names and HYDRA_MULTIRUN_DIR:
-            app.logger.info("Background Refresh: No TensorBoard data found. Checking LOG_ROOT_DIR subdirectories for potential Hydra overrides.")
-            try:
-                for item in Path(LOG_ROOT_DIR).iterdir():
-                    if item.is_dir():
-                        all_base_run_names.add(item.name)
-            except Exception as e_dir_list:
-                app.logger.error(f"Background Refresh: Error listing directories in {LOG_ROOT_DIR} for override check: {e_dir_list}")
-
-        if not all_base_run_names:
+        # 1.-7. Read scalars and hparams straight from the event files (no pandas DataFrame in between)
+        event_files = find_event_files(LOG_ROOT_DIR)
+        app.logger.info(f"Background Refresh: Found {len(event_files)} event files under {LOG_ROOT_DIR}.")
+        event_fingerprint = _event_files_fingerprint(event_files)
+        if event_fingerprint and LAST_EVENT_DATA is not None and LAST_EVENT_DATA[0] == event_fingerprint:
+            # No event file was added, removed or written to: reuse the parsed data, only redo the override lookup
+            app.logger.info("Background Refresh: Event files unchanged since the last refresh. Reusing parsed scalars and hparams.")
+            _, temp_cache, runs_to_keep, tracked_event_files, _ = LAST_EVENT_DATA
+        else:
+            # Runs whose event files did not change keep their merged and encoded scalars
+            previous_scalar_runs = LAST_EVENT_DATA[4] if LAST_EVENT_DATA is not None else None
+            temp_cache, runs_to_keep, tracked_event_files, scalar_runs = load_event_data(event_files, event_fingerprint, previous_scalar_runs)
+            LAST_EVENT_DATA = (event_fingerprint, temp_cache, runs_to_keep, tracked_event_files, scalar_runs)
+            if EVENT_CACHE_DIR:
+                pruned_count = prune_event_cache(EVENT_CACHE_DIR, LOG_ROOT_DIR, event_files)
+                if pruned_count > 0:
+                    app.logger.info(f"Background Refresh: Removed {pruned_count} event cache entries of deleted event files.")
+        # Copy what steps 8-10 and the follower modify, so LAST_EVENT_DATA stays as loaded
+        temp_cache = {run_name: dict(run_entry) for run_name, run_entry in temp_cache.items()}
+        runs_to_keep = set(runs_to_keep)
+        tracked_event_files = {file_path: dict(tracked) for file_path, tracked in tracked_event_files.items()}
+
+        if not temp_cache:
             app.logger.info("Background Refresh: No runs found from TensorBoard data or filesystem scan. Clearing cache.")
-            RUN_DATA_CACHE = {}
+            with CACHE_SWAP_LOCK:
+                if RUN_DATA_CACHE or not CACHE_UPDATED_AT: # Already empty: keep the generation, and with it ETags
+                    RUN_DATA_CACHE = MappingProxyType({})
+                    RUNS_INFO_JSON = b'[]'
+                    TRACKED_EVENT_FILES = {}
+                    CACHE_UPDATED_AT = time.time()
             CACHE_LOAD_TIME = time.time() - start_time
             app.logger.info(f"--- Background Refresh: Finished (no runs found). Cache cleared. Duration: {CACHE_LOAD_TIME:.2f}s ---")
             return
 
-        # 4. Initialize temp_cache for all identified base run names
-        for run_name in all_base_run_names:
-            temp_cache[run_name] = {
-                'scalars': {},
-                'hydra_overrides': None,
-                'hparams': None  # Initialize hparams entry
-            }
-        app.logger.info(f"Background Refresh: Identified {len(all_base_run_names)} potential runs to process.")
-
-        # 5. Process scalars
-        if df_scalars is not None and not df_scalars.empty:
-            app.logger.info(f"Background Refresh: Processing {len(df_scalars)} scalar data points...")
-            step_col, value_col, time_col, tag_col, run_col = ("step", "value", "wall_time", "tag", "dir_name")
-            required_cols = {step_col, value_col, time_col, tag_col, run_col}
-            if not required_cols.issubset(df_scalars.columns):
-                app.logger.error(f"Background Refresh: Missing required columns in scalar DataFrame. Found: {df_scalars.columns}, Required: {required_cols}")
-                # Handle critical missing 'dir_name' specifically if necessary, though tbparse should provide it.
-                missing = required_cols - set(df_scalars.columns)
-                app.logger.warning(f"Background Refresh: Missing optional columns: {missing}. Proceeding.")
-                required_cols = set(df_scalars.columns).intersection(required_cols)
-
-            df_scalars_cleaned = df_scalars[list(required_cols)].copy()
-            for col in [step_col, value_col, time_col]:
-                 if col in df_scalars_cleaned.columns:
-                     df_scalars_cleaned[col] = pd.to_numeric(df_scalars_cleaned[col], errors='coerce')
-            initial_rows = len(df_scalars_cleaned)
-            cols_to_check_na = [col for col in [step_col, value_col, time_col] if col in df_scalars_cleaned.columns]
-            if cols_to_check_na: df_scalars_cleaned.dropna(subset=cols_to_check_na, inplace=True)
-            if value_col in df_scalars_cleaned.columns: df_scalars_cleaned = df_scalars_cleaned[~df_scalars_cleaned[value_col].isin([float("inf"), -float("inf")])]
-            dropped_rows = initial_rows - len(df_scalars_cleaned)
-            if dropped_rows > 0: app.logger.debug(f"Background Refresh: Dropped {dropped_rows} rows with NaN/Inf values.")
-
-            if df_scalars_cleaned.empty:
-                app.logger.warning(f"Background Refresh: No valid scalar data remaining after cleaning.")
-            else: # df_scalars_cleaned has valid data
-                if step_col in df_scalars_cleaned.columns: df_scalars_cleaned[step_col] = df_scalars_cleaned[step_col].astype(int)
-                if time_col in df_scalars_cleaned.columns: df_scalars_cleaned[time_col] = df_scalars_cleaned[time_col].astype(float)
-                if run_col in df_scalars_cleaned.columns: df_scalars_cleaned[run_col] = df_scalars_cleaned[run_col].astype(str)
-
-                app.logger.info("Background Refresh: Restructuring scalar data for cache...")
-                grouped_by_run = df_scalars_cleaned.groupby(run_col)
-                for run_name, run_df in grouped_by_run:
-                    if run_name in temp_cache:
-                        # Ensure 'scalars' key is a defaultdict for this run
-                        temp_cache[run_name]['scalars'] = defaultdict(lambda: {"steps": [], "values": [], "wall_times": []})
-                        run_scalar_data_for_current_run = temp_cache[run_name]['scalars']
-                        grouped_by_tag = run_df.groupby(tag_col)
-                        for tag, tag_df in grouped_by_tag:
-                            tag_df_sorted = tag_df.sort_values(by=step_col) if step_col in tag_df.columns else tag_df
-                            if not tag_df_sorted.empty:
-                                if step_col in tag_df_sorted: run_scalar_data_for_current_run[tag]["steps"] = tag_df_sorted[step_col].to_list()
-                                if value_col in tag_df_sorted: run_scalar_data_for_current_run[tag]["values"] = tag_df_sorted[value_col].to_list()
-                                if time_col in tag_df_sorted: run_scalar_data_for_current_run[tag]["wall_times"] = tag_df_sorted[time_col].to_list()
-                        temp_cache[run_name]['scalars'] = dict(run_scalar_data_for_current_run) # Convert back to dict
-                    else:
-                        app.logger.warning(f"Background Refresh: Scalar data found for run '{run_name}' which was not in the initial list of runs. Skipping.")
-        else:
-            app.logger.info("Background Refresh: No scalar data found by tbparse.")
-
-        # 6. Initialize a set to keep track of runs that have any data (scalars, hparams, or overrides)
-        runs_to_keep = set()
-
-        # Populate runs_to_keep based on SCALARS processed earlier
-        for run_name, data in temp_cache.items():
-            if data.get('scalars') and data['scalars']: # Check for non-empty scalars dict
-                runs_to_keep.add(run_name)
-
-        # 7. Process HParams (using hparam_base_run_map)
-        if hparam_base_run_map:
-            app.logger.info(f"Background Refresh: Processing TensorBoard HParams for {len(hparam_base_run_map)} base runs...")
-            for base_run_name, hparam_rows_for_run in hparam_base_run_map.items():
-                if base_run_name in temp_cache and temp_cache[base_run_name]['hparams'] is None and hparam_rows_for_run:
-                    hparam_dict_to_store = {}
-                    metric_dict_to_store = {} # Reflects metric_dict={} in add_hparams call
-        
-                    processed_an_entry = False
-                    example_dir_name_for_log = "N/A"
-                    if hparam_rows_for_run:
-                         example_dir_name_for_log = hparam_rows_for_run[0].get('dir_name', "N/A")
-        
-                    for hparam_entry_row in hparam_rows_for_run: # hparam_entry_row is a pandas Series
-                        tag = hparam_entry_row.get('tag')
-                        value = hparam_entry_row.get('value')
-        
-                        if tag is not None:
-                            hparam_dict_to_store[tag] = value
-                            processed_an_entry = True
-        
-                    if not processed_an_entry and hparam_rows_for_run:
-                        app.logger.warning(
-                            f"Background Refresh: Hparam data from tbparse for run '{base_run_name}' "
-                            f"(from event file dir like '{example_dir_name_for_log}') did not yield "
-                            f"extractable tag/value pairs from its rows, or was structured unexpectedly. "
-                            f"Number of hparam event rows: {len(hparam_rows_for_run)}."
-                        )
-        
-                    temp_cache[base_run_name]['hparams'] = {
-                        'hparam_dict': hparam_dict_to_store,
-                        'metric_dict': metric_dict_to_store
-                    }
-                    if hparam_dict_to_store: # If any hparams were actually stored
-                        runs_to_keep.add(base_run_name)
-                    app.logger.debug(f"Background Refresh: Stored/updated TensorBoard hparams for run '{base_run_name}' from {len(hparam_rows_for_run)} event entries. HParams count: {len(hparam_dict_to_store)}, Metrics count: {len(metric_dict_to_store)}.")
-        else:
-            app.logger.info("Background Refresh: No TensorBoard hparam data found by tbparse.")
-
         # 8. Find Hydra Overrides
         # 8.1. Try Multirun Hydra overrides
         if HYDRA_MULTIRUN_DIR:
             app.logger.info(f"Background Refresh: Checking for Multirun Hydra overrides for {len(temp_cache)} potential runs...")
-            for run_name in list(temp_cache.keys()): # Iterate over keys list for safe modification
+            # One pass over the Submitit logs for all runs, instead of one pass per run
+            submitit_logs_by_run = list(index_submitit_logs(HYDRA_MULTIRUN_DIR, frozenset(temp_cache)).items())
+            # Each lookup is a few stats and one small read, so they run concurrently like the log scans
+            overrides_by_run = _thread_map(lambda run_and_log: find_hydra_overrides(*run_and_log), submitit_logs_by_run)
+            for (run_name, _), overrides_content in zip(submitit_logs_by_run, overrides_by_run):
                 # temp_cache entries are pre-initialized, so no need to check for run_name existence here
-                overrides_content = find_hydra_overrides(run_name, HYDRA_MULTIRUN_DIR, LOG_ROOT_DIR)
                 if overrides_content:
                     temp_cache[run_name]['hydra_overrides'] = overrides_content
                     runs_to_keep.add(run_name)
@@ -467,18 +1273,17 @@ def preload_all_runs_unified():
         # 8.2. Try Single-Run Hydra overrides if not found by multirun and dir is configured
         if HYDRA_SINGLE_RUN_LOG_DIR:
             app.logger.info(f"Background Refresh: Checking for Single-run Hydra overrides for runs not yet having multirun overrides...")
-            for run_name in list(temp_cache.keys()): # Iterate over all runs known so far
-                if temp_cache[run_name].get('hydra_overrides') is None: # Only if not already found by multirun
-                    app.logger.debug(f"Attempting single-run override search for: {run_name}")
-                    overrides_content_single = find_hydra_overrides_single_run(
-                        run_name,
-                        HYDRA_SINGLE_RUN_LOG_DIR,
-                        LOG_ROOT_DIR 
-                    )
-                    if overrides_content_single:
-                        temp_cache[run_name]['hydra_overrides'] = overrides_content_single
-                        runs_to_keep.add(run_name)
-                        app.logger.info(f"Background Refresh: Stored single-run overrides for run '{run_name}'.")
+            runs_without_overrides = frozenset(
+                run_name for run_name, run_entry in temp_cache.items()
+                if run_entry.get('hydra_overrides') is None # Only if not already found by multirun
+            )
+            job_dirs_by_run = list(index_hydra_single_run_logs(HYDRA_SINGLE_RUN_LOG_DIR, runs_without_overrides).items())
+            overrides_by_run = _thread_map(lambda run_and_dir: find_hydra_overrides_single_run(*run_and_dir), job_dirs_by_run)
+            for (run_name, _), overrides_content_single in zip(job_dirs_by_run, overrides_by_run):
+                if overrides_content_single:
+                    temp_cache[run_name]['hydra_overrides'] = overrides_content_single
+                    runs_to_keep.add(run_name)
+                    app.logger.info(f"Background Refresh: Stored single-run overrides for run '{run_name}'.")
 
         # 9. Filter temp_cache: keep only runs that have scalars, hparams, or overrides
         final_temp_cache = {
@@ -490,17 +1295,27 @@ def preload_all_runs_unified():
             app.logger.info(f"Background Refresh: Removed {removed_count} entries from cache that had no scalar data, hparams, or Hydra overrides.")
         temp_cache = final_temp_cache
         processed_runs_count = len(temp_cache)
-
-        # 10. Atomically update the global cache
-        RUN_DATA_CACHE = temp_cache
+        for run_name in HYDRA_OVERRIDES_READS.keys() - temp_cache.keys(): # Forget runs that are gone
+            del HYDRA_OVERRIDES_READS[run_name]
+
+        # 10. Atomically update the global cache, unless it already holds exactly this data
+        with CACHE_SWAP_LOCK:
+            if _cache_contents_unchanged(RUN_DATA_CACHE, temp_cache):
+                # A new generation would invalidate every ETag and cached compressed response for nothing
+                app.logger.info("Background Refresh: Runs, scalars, hparams and overrides unchanged. Keeping the published cache.")
+            else:
+                RUN_DATA_CACHE = MappingProxyType(temp_cache) # Read-only, so no handler can modify a published cache
+                RUNS_INFO_JSON = orjson.dumps(_get_runs_info_from_cache(temp_cache)) # The follower never changes the run set
+                TRACKED_EVENT_FILES = tracked_event_files # The follower continues from the offsets this cache was built from
+                CACHE_UPDATED_AT = time.time()
         CACHE_LOAD_TIME = time.time() - start_time
         app.logger.info(
             f"--- Background Refresh: Finished in {CACHE_LOAD_TIME:.2f}s. "
             f"Processed data for {processed_runs_count} runs into cache. ---"
         )
 
-    except ImportError as e: # Specific to tbparse/TensorFlow
-        app.logger.error(f"Background Refresh: ImportError during tbparse read: {e}. Is TensorFlow (or tbparse's backend) installed correctly?", exc_info=True)
+    except ImportError as e: # Specific to the tensorboard protobuf modules
+        app.logger.error(f"Background Refresh: ImportError while reading event files: {e}. Is the tensorboard package installed correctly?", exc_info=True)
         load_duration = time.time() - start_time
         app.logger.info(f"--- Background Refresh: Failed (ImportError). Duration: {load_duration:.2f}s ---")
     except Exception as e:
@@ -518,18 +1333,25 @@ def background_refresh_task():
             preload_all_runs_unified()
         except Exception as e: # Catch broad exceptions here to keep the thread alive
             app.logger.error(f"Exception in background refresh task loop: {e}", exc_info=True)
-        # Wait for the interval or until the stop event is set
-        stop_event.wait(REFRESH_INTERVAL_SECONDS)
+        # Wait for the interval (only for requests if periodic refreshes are disabled), until a refresh is requested,
+        # or until the stop event is set
+        if REFRESH_REQUESTED.wait(REFRESH_INTERVAL_SECONDS if REFRESH_INTERVAL_SECONDS > 0 else None):
+            # Let a burst of changes (e.g., many runs starting at once) settle into a single refresh
+            while REFRESH_REQUESTED.is_set() and not stop_event.is_set():
+                REFRESH_REQUESTED.clear()
+                stop_event.wait(WATCH_DEBOUNCE_SECONDS)
     app.logger.info("Background refresh thread stopped.")
 
 def start_background_refresh():
-    """Starts the background refresh thread."""
+    """Starts the background refresh thread, which refreshes right away and then waits for the next interval or request."""
     global background_thread
-    if background_thread is None or not background_thread.is_alive():
-        stop_event.clear()
-        background_thread = threading.Thread(target=background_refresh_task, daemon=True)
-        background_thread.start()
-        app.logger.info("Background refresh thread initiated.")
+    with BACKGROUND_THREAD_LOCK:
+        if background_thread is None or not background_thread.is_alive():
+            stop_event.clear()
+            REFRESH_REQUESTED.clear()
+            background_thread = threading.Thread(target=background_refresh_task, daemon=True)
+            background_thread.start()
+            app.logger.info("Background refresh thread initiated.")
 
 def stop_background_refresh():
     """Signals the background refresh thread to stop."""
@@ -537,6 +1359,7 @@ def stop_background_refresh():
     if background_thread and background_thread.is_alive():
         app.logger.info("Signaling background refresh thread to stop...")
         stop_event.set()
+        REFRESH_REQUESTED.set() # Wakes the thread from its interval wait
         background_thread.join(timeout=10) # Increased timeout slightly
         if background_thread.is_alive():
             app.logger.warning("Background refresh thread did not stop gracefully after 10s.")
@@ -544,9 +1367,181 @@ def stop_background_refresh():
             app.logger.info("Background refresh thread joined.")
         background_thread = None
 
+def start_event_file_watcher():
+    """
+    Requests a background refresh as soon as event files are created, moved or deleted below
+    LOG_ROOT_DIR, instead of waiting for the refresh interval. Needs the optional watchdog package;
+    data appended to existing event files is handled by the event file follower.
+
+    Returns:
+        bool: Whether the watcher is running.
+    """
+    global watch_observer
+    if Observer is None:
+        return False
+
+    class EventFileWatchHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.event_type not in ("created", "moved", "deleted"):
+                return # Writes to existing files are picked up by the follower
+            changed_paths = [os.fsdecode(event.src_path), os.fsdecode(getattr(event, "dest_path", "") or "")]
+            # Removing or renaming a directory can remove whole runs, without per-file events
+            if (event.is_directory and event.event_type != "created") or any("tfevents" in os.path.basename(path) for path in changed_paths):
+                REFRESH_REQUESTED.set()
+
+    try:
+        watch_observer = Observer()
+        watch_observer.schedule(EventFileWatchHandler(), LOG_ROOT_DIR, recursive=True)
+        watch_observer.daemon = True
+        watch_observer.start()
+    except Exception as e_watch: # E.g., the inotify watch limit is reached on very large log trees
+        app.logger.warning(f"Could not watch {LOG_ROOT_DIR} for new event files: {e_watch}. Relying on the refresh interval.")
+        watch_observer = None
+        return False
+    app.logger.info(f"Watching {LOG_ROOT_DIR} for new event files.")
+    return True
+
+def stop_event_file_watcher():
+    """Stops the event file watcher."""
+    global watch_observer
+    if watch_observer is not None:
+        watch_observer.stop()
+        watch_observer.join(timeout=10)
+        watch_observer = None
+
+
+# --- Event File Follower ---
+def follow_event_files():
+    """
+    Appends data written to known event files since the cache was built, without a full refresh.
+
+    Only the bytes after each grown file's last parsed offset are read. Affected runs get new
+    entries in a copy of RUN_DATA_CACHE, which then replaces the global cache. New event files,
+    new runs and hparams are left to the next full refresh.
+
+    Reading, merging and encoding happen without holding CACHE_SWAP_LOCK. The lock is only taken
+    to publish, and the result is dropped if a full refresh swapped in a new cache meanwhile;
+    that cache comes with its own offsets, so the next call reads the appended data again.
+
+    Returns:
+        int: Number of scalar series that received new points.
+    """
+    global RUN_DATA_CACHE, CACHE_UPDATED_AT
+    tracked_event_files, base_cache = TRACKED_EVENT_FILES, RUN_DATA_CACHE # The generation this call builds on
+    new_offsets = {} # file_path -> (size, end_offset), applied only if the generation is still current
+    new_parts_by_run = {} # run_name -> {tag: [tail series, ...]}
+    for file_path, tracked in tracked_event_files.items():
+        try:
+            file_size = os.stat(file_path).st_size
+        except OSError:
+            continue # Deleted; the next full refresh drops it
+        if file_size <= tracked['size']:
+            continue
+        try:
+            tail = read_event_file(file_path, VERIFY_EVENT_CRC, start_offset=tracked['end_offset'])
+        except Exception as e_read:
+            app.logger.warning(f"Event File Follower: Could not read appended data of {file_path}: {e_read}")
+            continue
+        new_offsets[file_path] = (file_size, tail['end_offset'])
+        if tail['scalars'] and tracked['run'] in base_cache:
+            run_parts = new_parts_by_run.setdefault(tracked['run'], {})
+            for tag, series in tail['scalars'].items():
+                run_parts.setdefault(tag, []).append(series)
+    if not new_offsets:
+        return 0
+
+    updated_series_count = 0
+    new_cache = None
+    if new_parts_by_run:
+        new_cache = dict(base_cache)
+        for run_name, tag_parts in new_parts_by_run.items():
+            run_entry = dict(new_cache[run_name])
+            run_entry['scalars'] = dict(run_entry['scalars'])
+            run_entry['scalars_json'] = dict(run_entry['scalars_json'])
+            for tag, series_parts in tag_parts.items():
+                existing_entry = run_entry['scalars'].get(tag)
+                if existing_entry is not None:
+                    series_parts = [(existing_entry['steps'], existing_entry['values'], existing_entry['wall_times'])] + series_parts
+                tag_entry = merge_scalar_series(series_parts)
+                if tag_entry is None:
+                    continue
+                run_entry['scalars'][tag] = tag_entry
+                run_entry['scalars_json'][tag] = encode_scalar_series(tag_entry)
+                updated_series_count += 1
+            new_cache[run_name] = run_entry
+
+    with CACHE_SWAP_LOCK:
+        if TRACKED_EVENT_FILES is not tracked_event_files or RUN_DATA_CACHE is not base_cache:
+            app.logger.debug("Event File Follower: A refresh replaced the cache while reading; dropping this update.")
+            return 0
+        for file_path, (file_size, end_offset) in new_offsets.items():
+            tracked = tracked_event_files[file_path]
+            tracked['size'], tracked['end_offset'] = file_size, end_offset
+        if updated_series_count > 0:
+            RUN_DATA_CACHE = MappingProxyType(new_cache)
+            CACHE_UPDATED_AT = time.time() # New cache generation: invalidates ETags and cached compressed responses
+    return updated_series_count
+
+def follow_task():
+    """Periodically calls follow_event_files, pausing at least FOLLOW_INTERVAL_SECONDS in between."""
+    app.logger.info(f"Event file follower thread started. Interval: {FOLLOW_INTERVAL_SECONDS}s")
+    while not stop_event.is_set():
+        follow_start_time = time.time()
+        try:
+            updated_series_count = follow_event_files()
+            if updated_series_count:
+                app.logger.debug(f"Event File Follower: Appended new points to {updated_series_count} scalar series.")
+        except Exception as e: # Keep the thread alive
+            app.logger.error(f"Exception in event file follower loop: {e}", exc_info=True)
+        # Back off when following itself gets expensive (very many files)
+        stop_event.wait(max(FOLLOW_INTERVAL_SECONDS, 0.1 * (time.time() - follow_start_time)))
+    app.logger.info("Event file follower thread stopped.")
+
+def start_event_file_follower():
+    """Starts the event file follower thread."""
+    global follow_thread
+    if follow_thread is None or not follow_thread.is_alive():
+        stop_event.clear()
+        follow_thread = threading.Thread(target=follow_task, daemon=True)
+        follow_thread.start()
+        app.logger.info("Event file follower thread initiated.")
+
+def stop_event_file_follower():
+    """Signals the event file follower thread to stop."""
+    global follow_thread
+    if follow_thread and follow_thread.is_alive():
+        stop_event.set()
+        follow_thread.join(timeout=10)
+        if follow_thread.is_alive():
+            app.logger.warning("Event file follower thread did not stop gracefully after 10s.")
+        follow_thread = None
+
 
 # --- API Endpoints ---
 
+def _cache_etag(cache_updated_at):
+    """Strong ETag for a response that only depends on the cache generation and the request's query."""
+    return hashlib.blake2b(f"{cache_updated_at}:{request.full_path}".encode(), digest_size=8).hexdigest()
+
+def _is_not_modified(etag):
+    # Flask-Compress appends ':<encoding>' to the ETag of compressed responses, so accept those forms too
+    candidates = [etag] + [f"{etag}:{algorithm}" for algorithm in app.config["COMPRESS_ALGORITHM"]]
+    return any(request.if_none_match.contains(candidate) for candidate in candidates)
+
+def _set_cache_validators(response, etag, cache_updated_at):
+    response.set_etag(etag)
+    response.last_modified = cache_updated_at
+    response.cache_control.no_cache = True # Revalidate every time: a refresh can change the data at any moment
+    return response
+
+def _content_response(body, mimetype):
+    """Response whose ETag is a hash of its body, for per-run data that usually outlives cache generations."""
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    response = Response(status=304) if _is_not_modified(etag) else Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
 def _get_runs_info_from_cache(cache_to_inspect):
     available_runs_info = []
     for run_name in sorted(cache_to_inspect.keys()):
@@ -561,10 +1556,12 @@ def _get_runs_info_from_cache(cache_to_inspect):
 @app.route("/api/runs")
 def get_runs():
     app.logger.debug(f"Request received for /api/runs")
-    current_cache_snapshot = RUN_DATA_CACHE.copy() # Shallow copy for safe iteration
-    available_runs_info = _get_runs_info_from_cache(current_cache_snapshot)
-    app.logger.debug(f"Returning {len(available_runs_info)} available runs from cache with override and hparam status.")
-    return jsonify(available_runs_info)
+    cache_updated_at = g.cache_updated_at # Read before the cache, so a concurrent swap can only make the ETag stale
+    etag = _cache_etag(cache_updated_at)
+    if _is_not_modified(etag):
+        return _set_cache_validators(Response(status=304), etag, cache_updated_at)
+    app.logger.debug("Returning the available runs from cache with override and hparam status.")
+    return _set_cache_validators(Response(RUNS_INFO_JSON, mimetype='application/json'), etag, cache_updated_at)
 
 # New: Endpoint to get TensorBoard hparams for a specific run
 @app.route("/api/hparams")
@@ -575,7 +1572,7 @@ def get_hparams():
 
     app.logger.debug(f"Request: /api/hparams for run: {run_name}")
 
-    # Access cache safely (RUN_DATA_CACHE is thread-safe for reads due to GIL and atomic replacement)
+    # Access cache safely (RUN_DATA_CACHE is a read-only view that is only ever replaced as a whole)
     run_data = RUN_DATA_CACHE.get(run_name)
     if not run_data:
         app.logger.warning(f"Run '{run_name}' not found in current cache for hparams request.")
@@ -587,7 +1584,7 @@ def get_hparams():
         return jsonify({"error": f"No TensorBoard hparams found for run '{run_name}'"}), 404
 
     app.logger.debug(f"Returning TensorBoard hparams for run '{run_name}'.")
-    return jsonify(hparams_content)
+    return _content_response(orjson.dumps(hparams_content, option=OrjsonProvider.OPTIONS), 'application/json')
 
 
 # Endpoint to get hydra overrides for a specific run
@@ -610,29 +1607,20 @@ def get_overrides():
         return jsonify({"error": f"No Hydra overrides found for run '{run_name}'"}), 404
 
     app.logger.debug(f"Returning Hydra overrides for run '{run_name}'.")
-    return Response(overrides_content, mimetype='text/plain')
+    return _content_response(overrides_content.encode('utf-8'), 'text/plain')
 
 @app.route("/api/refresh", methods=['POST'])
 def trigger_refresh_and_return_cached_runs():
     app.logger.info("POST /api/refresh: Request received. Will return current cached runs and trigger background refresh.")
 
-    current_cache_snapshot = RUN_DATA_CACHE.copy()
-    runs_to_return = _get_runs_info_from_cache(current_cache_snapshot)
-    app.logger.debug(f"/api/refresh: Prepared {len(runs_to_return)} cached runs for immediate response.")
-
-    def do_refresh_on_demand():
-        app.logger.info("/api/refresh: Starting on-demand background refresh.")
-        try:
-            preload_all_runs_unified()
-            app.logger.info("/api/refresh: On-demand background refresh completed successfully.")
-        except Exception as e:
-            app.logger.error(f"/api/refresh: Exception during on-demand background refresh: {e}", exc_info=True)
+    runs_to_return = RUNS_INFO_JSON # Encoded when the current cache was published
 
-    refresh_thread = threading.Thread(target=do_refresh_on_demand, daemon=True)
-    refresh_thread.start()
-    app.logger.info("/api/refresh: Initiated on-demand background refresh in a new thread.")
+    # Requests arriving while a refresh is pending or running coalesce into one further refresh
+    REFRESH_REQUESTED.set()
+    start_background_refresh() # Only starts a thread if periodic refreshes are disabled (or it died)
+    app.logger.info("/api/refresh: Requested a background refresh.")
 
-    return jsonify(runs_to_return)
+    return Response(runs_to_return, mimetype='application/json')
 
 
 
@@ -640,39 +1628,45 @@ def trigger_refresh_and_return_cached_runs():
 @app.route("/api/data")
 def get_data():
     selected_runs_str = request.args.get("runs", "")
-    if not selected_runs_str:
+    selected_runs = list(dict.fromkeys(filter(None, selected_runs_str.split(",")))) # Drops empty and repeated names
+    if not selected_runs:
         return jsonify({"error": "No runs specified"}), 400
-
-    selected_runs = selected_runs_str.split(",")
+    resolution = request.args.get("resolution", "full")
+    if resolution not in ("full", "low"):
+        return jsonify({"error": f"Unknown resolution '{resolution}', expected 'full' or 'low'"}), 400
+
+    cache_updated_at = g.cache_updated_at # Read before the cache, so a concurrent swap can only make the ETag stale
+    etag = _cache_etag(cache_updated_at)
+    if _is_not_modified(etag):
+        app.logger.debug(f"Request: /api/data for runs: {selected_runs} not modified since the last response.")
+        return _set_cache_validators(Response(status=304), etag, cache_updated_at)
     app.logger.info(f"Request: /api/data for runs: {selected_runs} (serving scalars from cache)")
 
-    all_metrics_data = defaultdict(dict)
+    metric_fragments = defaultdict(list) # metric_name -> [b'"run":{...}', ...]
     start_time = time.time()
     runs_served_count = 0
-    runs_missing_or_no_scalars = []
     metrics_collected = set()
 
     # Access cache safely
-    current_cache_snapshot = RUN_DATA_CACHE # Direct access is fine due to GIL / atomic replacement
+    current_cache_snapshot = RUN_DATA_CACHE # One read of the global, so every run comes from the same cache generation
+    runs_missing = set(selected_runs) - current_cache_snapshot.keys() # Validated in one C-level set operation
+    runs_without_scalars = []
 
     for run_name in selected_runs:
-        run_cache_entry = current_cache_snapshot.get(run_name)
-        run_scalars_from_cache = run_cache_entry.get('scalars') if run_cache_entry else None
-
-        if run_scalars_from_cache: # Check if run exists AND has scalar data
-            served_run = False
-            for metric_name, metric_data in run_scalars_from_cache.items():
-                if isinstance(metric_data, dict) and metric_data.get("steps"): # Check for actual data
-                    all_metrics_data[metric_name][run_name] = metric_data
-                    metrics_collected.add(metric_name)
-                    served_run = True
-            if served_run:
-                runs_served_count += 1
-            else:
-                # This case means the run was in cache, 'scalars' key existed, but was empty or malformed.
-                runs_missing_or_no_scalars.append(f"{run_name} (no valid scalar entries)")
-        else:
-            runs_missing_or_no_scalars.append(run_name)
+        if run_name in runs_missing:
+            continue
+        run_scalars_json = current_cache_snapshot[run_name]['scalars_json']
+        if not run_scalars_json: # In the cache for its hparams or overrides only
+            runs_without_scalars.append(run_name)
+            continue
+        run_key = orjson.dumps(run_name)
+        run_scalars = current_cache_snapshot[run_name]['scalars']
+        for metric_name, metric_json in run_scalars_json.items():
+            if resolution == "low":
+                metric_json = encode_downsampled_series(run_scalars[metric_name]) or metric_json # Short series are always sent in full
+            metric_fragments[metric_name].append(run_key + b':' + metric_json)
+        metrics_collected.update(run_scalars_json)
+        runs_served_count += 1
 
     duration = time.time() - start_time
     log_message = (
@@ -680,15 +1674,22 @@ def get_data():
         f"Served scalar data for {runs_served_count}/{len(selected_runs)} requested runs. "
         f"Collected {len(metrics_collected)} distinct scalar metrics."
     )
-    if runs_missing_or_no_scalars:
-        log_message += f" Runs missing or no/empty scalars: {runs_missing_or_no_scalars}"
+    if runs_missing:
+        log_message += f" Runs missing from cache: {sorted(runs_missing)}."
+    if runs_without_scalars:
+        log_message += f" Runs without scalars: {runs_without_scalars}."
     app.logger.info(log_message)
 
-    if not all_metrics_data: # Covers cases where no runs served, or served runs had no common/valid data
+    if not metric_fragments: # Covers cases where no runs served, or served runs had no common/valid data
          app.logger.warning(f"No scalar data to return for selected runs: {selected_runs}")
-         return jsonify({})
+         return _set_cache_validators(jsonify({}), etag, cache_updated_at)
 
-    return jsonify(dict(all_metrics_data))
+    # Stitch {"metric": {"run": <cached JSON>, ...}, ...} together from the pre-encoded fragments
+    body = b'{' + b','.join(
+        orjson.dumps(metric_name) + b':{' + b','.join(fragments) + b'}'
+        for metric_name, fragments in metric_fragments.items()
+    ) + b'}'
+    return _set_cache_validators(Response(body, mimetype='application/json'), etag, cache_updated_at)
 
 
 # --- Static File Serving (Keep as before) ---
@@ -711,7 +1712,7 @@ def serve_static(filename):
 
 # --- Main Execution / CLI Entry Point (Modified) ---
 def main():
-    global LOG_ROOT_DIR, HYDRA_MULTIRUN_DIR, REFRESH_INTERVAL_SECONDS, HYDRA_SINGLE_RUN_LOG_DIR
+    global LOG_ROOT_DIR, HYDRA_MULTIRUN_DIR, REFRESH_INTERVAL_SECONDS, FOLLOW_INTERVAL_SECONDS, HYDRA_SINGLE_RUN_LOG_DIR, VERIFY_EVENT_CRC, EVENT_CACHE_DIR
 
     parser = argparse.ArgumentParser(
         description="p-board: A faster TensorBoard log viewer with Hydra and HParams support."
@@ -743,6 +1744,26 @@ def main():
         default=REFRESH_INTERVAL_SECONDS, # Use global default
         help=f"Interval (seconds) for background data refresh (default: {REFRESH_INTERVAL_SECONDS}). Set to 0 to disable.",
     )
+    parser.add_argument(
+        "--follow-interval",
+        type=float,
+        default=FOLLOW_INTERVAL_SECONDS,
+        help=f"Minimum interval (seconds) between checks for data appended to known event files "
+             f"(default: {FOLLOW_INTERVAL_SECONDS}). Set to 0 to disable.",
+    )
+    parser.add_argument(
+        "--no-verify-crc",
+        action="store_true",
+        help="Skip CRC32C verification of event file records. Verification is only done when the optional "
+             "google-crc32c package is installed.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=EVENT_CACHE_DIR,
+        help=f"Directory for caching parsed event files between launches (default: {EVENT_CACHE_DIR}).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Do not cache parsed event files on disk.")
     parser.add_argument("--port", type=int, default=5001, help="Port number.")
     parser.add_argument("--host", type=str, default="127.0.0.1", help="Host address.")
     parser.add_argument("--no-browser", action="store_true", help="Do not open browser.")
@@ -751,6 +1772,17 @@ def main():
     args = parser.parse_args()
 
     REFRESH_INTERVAL_SECONDS = args.refresh_interval
+    FOLLOW_INTERVAL_SECONDS = args.follow_interval
+
+    if args.no_verify_crc:
+        VERIFY_EVENT_CRC = False
+        print("p-board: Event file CRC verification disabled.")
+    elif google_crc32c is None:
+        print("p-board: google-crc32c not installed. Event file CRCs will not be verified.")
+
+    EVENT_CACHE_DIR = None if args.no_cache else os.path.abspath(os.path.expanduser(args.cache_dir))
+    if EVENT_CACHE_DIR:
+        print(f"p-board: Caching parsed event files in: {EVENT_CACHE_DIR}")
 
     LOG_ROOT_DIR = os.path.abspath(args.logdir)
     print(f"p-board: Using log directory: {LOG_ROOT_DIR}")
@@ -802,9 +1834,21 @@ def main():
         # Register the stop function to be called on exit
         atexit.register(stop_background_refresh)
         print(f"p-board: Background refresh enabled every {REFRESH_INTERVAL_SECONDS} seconds.")
+        if start_event_file_watcher():
+            atexit.register(stop_event_file_watcher)
+            print("p-board: New event files trigger a refresh right away.")
+        else:
+            print("p-board: watchdog not installed or unavailable. New event files are found by the periodic refresh.")
     else:
         print("p-board: Background refresh disabled.")
 
+    if FOLLOW_INTERVAL_SECONDS > 0:
+        start_event_file_follower()
+        atexit.register(stop_event_file_follower)
+        print(f"p-board: Following appended event data every {FOLLOW_INTERVAL_SECONDS} seconds.")
+    else:
+        print("p-board: Following appended event data disabled.")
+
 
     # --- Browser opening and server start ---
     if not args.no_browser:
@@ -824,8 +1868,10 @@ def main():
     use_reloader_flag = False # Generally safer to disable Flask reloader with threads
     if args.debug:
          print("p-board: Flask debug mode is ON, but Flask's auto-reloader is disabled for stability with background tasks.")
-
-    app.run(debug=args.debug, port=args.port, host=args.host, use_reloader=use_reloader_flag)
+         app.run(debug=args.debug, port=args.port, host=args.host, use_reloader=use_reloader_flag)
+    else:
+        # RUN_DATA_CACHE is only ever replaced, never mutated, so requests can be served from many threads
+        serve(app, host=args.host, port=args.port, threads=min(32, (os.cpu_count() or 1) * 4))
 
 
 if __name__ == "__main__":
@@ -525,6 +525,16 @@ async function fetchRuns() {
     }
 }
 
+// /api/data sends steps as {first_step, step_deltas}; rebuild the absolute steps array
+function decodeScalarSeries(seriesData) {
+    if (!seriesData || !seriesData.step_deltas) return seriesData;
+    const deltas = seriesData.step_deltas;
+    const steps = new Array(deltas.length + 1);
+    steps[0] = seriesData.first_step;
+    for (let i = 0; i < deltas.length; i++) { steps[i + 1] = steps[i] + deltas[i]; }
+    return { steps, values: seriesData.values, wall_times: seriesData.wall_times };
+}
+
 async function fetchDataForSelectedRuns() {
     clearError();
 
@@ -579,7 +589,7 @@ async function fetchDataForSelectedRuns() {
                 for (const runName in fetchedScalarData[metricName]) {
                     if (runsToFetchScalars.includes(runName)) { // Ensure we only cache what we asked for
                         // We already ensured frontendDataCache[runName].scalars exists
-                        frontendDataCache[runName].scalars[metricName] = fetchedScalarData[metricName][runName];
+                        frontendDataCache[runName].scalars[metricName] = decodeScalarSeries(fetchedScalarData[metricName][runName]);
                     }
                 }
             }